@@ -178,6 +178,8 @@ from xtgeo.grid3d.grid import grid_from_roxar
 from xtgeo.grid3d.grid import create_box_grid
 
 from xtgeo.grid3d.grid_property import gridproperty_from_file
+from xtgeo.grid3d.grid_property import gridproperty_from_files
+from xtgeo.grid3d.grid_property import gridproperty_cache_clear
 from xtgeo.grid3d.grid_property import gridproperty_from_roxar
 
 from xtgeo.grid3d.grid_properties import gridproperties_from_file
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Module for basic XTGeo interaction with OS/system files and folders."""
 
+import functools
 import hashlib
 import io
 import os
@@ -52,6 +53,26 @@ SUPPORTED_FORMATS = {
 VALID_FILE_ALIASES = ["$fmu-v1", "$md5sum", "$random"]
 
 
+@functools.lru_cache(maxsize=256)
+def _format_by_name(name):
+    """Return the generic format for a format name or file suffix, or None.
+
+    Exact names are tried before the regular expressions. This is memoized as it
+    is looked up on every file import.
+    """
+    for fmt, variants in SUPPORTED_FORMATS.items():
+        if name in variants:
+            return fmt
+
+    # (intentional to complete all variant in loop above first before trying re())
+    for fmt, variants in SUPPORTED_FORMATS.items():
+        for var in variants:
+            if "*" in var and re.match(var, name):
+                return fmt
+
+    return None
+
+
 def npfromfile(fname, dtype=np.float32, count=1, offset=0, mmap=False):
     """Wrapper round np.fromfile to be compatible with older np versions."""
     try:
@@ -373,8 +394,7 @@ class _XTGeoFile(object):
         logger.info("Run splitext to get stem and suffix...")
 
         stem = self._file.stem
-        suffix = self._file.suffix
-        suffix = suffix.replace(".", "")
+        suffix = self._file.suffix[1:]  # suffix is either empty or starts with "."
 
         if lower:
             stem = stem.lower()
@@ -530,10 +550,12 @@ class _XTGeoFile(object):
             buf = self.file.read(maxbuf)
             self.file.seek(0)
         else:
-            if not self.exists():
-                raise ValueError(f"File {self.name} does not exist")
-            with open(self.file, "rb") as fhandle:
-                buf = fhandle.read(maxbuf)
+            # just try to open, a separate check for existence is an extra syscall
+            try:
+                with open(self.file, "rb") as fhandle:
+                    buf = fhandle.read(maxbuf)
+            except FileNotFoundError as err:
+                raise ValueError(f"File {self.name} does not exist") from err
 
         if not isinstance(buf, bytes):
             return None
@@ -639,22 +661,10 @@ class _XTGeoFile(object):
         if self.memstream:
             return "unknown"
 
-        suffix = self.file.suffix[1:].lower()
-
-        for fmt, variants in SUPPORTED_FORMATS.items():
-            if suffix in variants:
-                logger.info(f"Extension hints {fmt}")
-                return fmt
-
-        # if none of these above are accepted, check regular expression
-        # (intentional to complete all variant in loop above first before trying re())
-        for fmt, variants in SUPPORTED_FORMATS.items():
-            for var in variants:
-                if "*" in var:
-                    pattern = re.compile(var)
-                    if pattern.match(suffix):
-                        logger.info(f"Extension by regexp hints {fmt}")
-                        return fmt
+        fmt = _format_by_name(self.file.suffix[1:].lower())
+        if fmt is not None:
+            logger.info("Extension hints %s", fmt)
+            return fmt
 
         return "unknown"
 
@@ -669,17 +679,9 @@ class _XTGeoFile(object):
     @staticmethod
     def generic_format_by_proposal(propose):
         """Get generic format by proposal."""
-        for fmt, variants in SUPPORTED_FORMATS.items():
-            if propose in variants:
-                return fmt
-
-        # if none of these above are accepted, check regular expression
-        for fmt, variants in SUPPORTED_FORMATS.items():
-            for var in variants:
-                if "*" in var:
-                    pattern = re.compile(var)
-                    if pattern.match(propose):
-                        return fmt
+        fmt = _format_by_name(propose)
+        if fmt is not None:
+            return fmt
 
         raise ValueError(f"Non-supportred file extension: {propose}")
 
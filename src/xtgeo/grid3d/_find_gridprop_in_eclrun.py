@@ -7,8 +7,8 @@ from typing import Dict, List, Optional, Union
 
 import ecl_data_io as eclio
 import numpy as np
-import xtgeo
 from typing_extensions import Literal
+from xtgeo.common.constants import UNDEF, UNDEF_INT
 
 from ._ecl_inte_head import InteHead
 from ._ecl_logi_head import LogiHead
@@ -306,9 +306,9 @@ def match_values_to_active_cells(
         )
 
     if np.issubdtype(values.dtype, np.integer):
-        undef = xtgeo.UNDEF_INT
+        undef = UNDEF_INT
     else:
-        undef = xtgeo.UNDEF
+        undef = UNDEF
     result = np.full(fill_value=undef, shape=num_cells, dtype=values.dtype)
     result[actind] = values
     return result
@@ -481,6 +481,12 @@ def find_gridprops_from_restart_file_sections(
     first_date = None
     last_date = None
     read_properties = dict()
+    lengths = valid_gridprop_lengths(grid)
+    if dates not in ("all", "first", "last"):
+        if not dates:
+            return []
+        dates = set(dates)
+        dates_not_found = set(dates)
     for section in sections:
         intehead, logihead, section = peek_headers(section)
         check_grid_match(intehead, logihead, grid)
@@ -488,12 +494,18 @@ def find_gridprops_from_restart_file_sections(
 
         if dates not in ("all", "first", "last"):
             if date not in dates:
+                # report steps may repeat or go back in time for restarted
+                # runs, hence the scan is only stopped when all requested
+                # dates are found and their sections are passed
+                if not dates_not_found:
+                    break
                 continue
+            dates_not_found.discard(date)
 
         section_properties = {
             (name, date): gridprop_params(v, name, date, grid, fracture)
             for name, v in read_values(
-                section, intehead, names, lengths=valid_gridprop_lengths(grid)
+                section, intehead, names, lengths=lengths
             ).items()
         }
 
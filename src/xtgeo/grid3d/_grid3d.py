@@ -10,6 +10,8 @@ logger = xtg.functionlogger(__name__)
 class _Grid3D(object):
     """Abstract base class for Grid3D."""
 
+    __slots__ = ("_ncol", "_nrow", "_nlay")
+
     def __init__(self, ncol=4, nrow=3, nlay=5):
 
         self._ncol = ncol
@@ -9,6 +9,7 @@ import roffio
 import xtgeo
 from xtgeo.common import XTGeoDialog
 
+from ._gridprop_lowlevel import filled_values
 from ._roff_parameter import RoffParameter
 
 xtg = XTGeoDialog()
@@ -72,24 +73,20 @@ def export_roff(self, pfile, name, binary=True):
 
 def export_grdecl(self, pfile, name, append=False, binary=False, dtype=None, fmt=None):
     """Export ascii or binary GRDECL"""
-    vals = self.values.ravel(order="F")
-    if np.ma.isMaskedArray(vals):
-        vals = np.ma.filled(vals, self.undef)
-
     if binary:
         mode = "wb"
         if append:
             mode = "ab"
 
+        if dtype is None:
+            dtype = np.int32 if self.isdiscrete else np.float32
+        vals = filled_values(self.values, self.undef, dtype=dtype, order="F")
+
         with open(pfile, mode) as fh:
-            if dtype is not None:
-                eclio.write(fh, [(name.ljust(8), vals.astype(dtype))])
-            elif self.isdiscrete:
-                eclio.write(fh, [(name.ljust(8), vals.astype(np.int32))])
-            else:
-                eclio.write(fh, [(name.ljust(8), vals.astype(np.float32))])
+            eclio.write(fh, [(name.ljust(8), vals.ravel(order="F"))])
 
     else:
+        vals = filled_values(self.values, self.undef, order="F").ravel(order="F")
         mode = "w"
         if append:
             mode = "a"
@@ -113,7 +110,7 @@ def export_grdecl(self, pfile, name, append=False, binary=False, dtype=None, fmt
 def export_xtgcpprop(self, mfile):
     """Export to experimental xtgcpproperty format, python version."""
     logger.info("Export as xtgcpprop...")
-    self._metadata.required = self
+    self.metadata.required = self
 
     magic = 1351
     if self.isdiscrete:
@@ -129,8 +126,8 @@ def export_xtgcpprop(self, mfile):
         fout.write(pre)
 
     with open(mfile, "ab") as fout:
-        vv = self.get_npvalues1d(fill_value=self.undef)
-        vv.astype(np.float32).tofile(fout)
+        vv = filled_values(self.values, self.undef, dtype=np.float32)
+        vv.tofile(fout)
 
     with open(mfile, "ab") as fout:
         fout.write("\nXTGMETA.v01\n".encode())
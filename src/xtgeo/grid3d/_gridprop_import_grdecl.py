@@ -48,7 +48,9 @@ def import_bgrdecl_prop(pfile, name, grid):
                 result["codes"] = {}
                 result["roxar_dtype"] = np.float32
             result["values"] = ma.masked_where(
-                grid.get_actnum().values < 1, values.reshape(grid.dimensions, order="F")
+                grid.get_actnum().values < 1,
+                values.reshape(grid.dimensions, order="F"),
+                copy=False,
             )
             return result
 
@@ -86,7 +88,7 @@ def read_grdecl_3d_property(filename, keyword, dimensions, dtype=float):
             ) from si
 
     # The values are stored in F order in the grdecl file
-    f_order_values = np.array([dtype(v) for v in result])
+    f_order_values = np.array(result, dtype=dtype)
     return np.ascontiguousarray(f_order_values.reshape(dimensions, order="F"))
 
 
@@ -101,6 +103,8 @@ def import_grdecl_prop(pfile, name, grid):
     actnumv = grid.get_actnum().values
 
     result["values"] = ma.masked_where(
-        actnumv == 0, read_grdecl_3d_property(pfile.file, name, grid.dimensions, float)
+        actnumv == 0,
+        read_grdecl_3d_property(pfile.file, name, grid.dimensions, float),
+        copy=False,
     )
     return result
@@ -37,6 +37,7 @@ def import_roff(pfile, name=None, grid=None):
         result["values"] = np.ma.masked_where(
             grid.get_actnum().values < 1,
             result["values"],
+            copy=False,
         )
 
     roff_val = roff_param.values
@@ -8,6 +8,7 @@ import numpy as np
 
 import xtgeo
 import xtgeo.common.sys as xsys
+from xtgeo.common.constants import UNDEF, UNDEF_INT
 
 xtg = xtgeo.common.XTGeoDialog()
 
@@ -74,7 +75,8 @@ def import_xtgcpprop(mfile, ijrange=None, zerobased=False):
 
     result["values"] = np.ma.masked_equal(
         vals.reshape((result["ncol"], result["nrow"], result["nlay"])),
-        xtgeo.UNDEF_INT if result["discrete"] else xtgeo.UNDEF,
+        UNDEF_INT if result["discrete"] else UNDEF,
+        copy=False,
     )
     return result
 
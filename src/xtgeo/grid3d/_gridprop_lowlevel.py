@@ -4,9 +4,9 @@
 import numpy as np
 import numpy.ma as ma
 
-import xtgeo
 import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 from xtgeo.common import XTGeoDialog
+from xtgeo.common.constants import UNDEF, UNDEF_INT
 
 xtg = XTGeoDialog()
 
@@ -33,6 +33,110 @@ def c2f_order(obj, values1d):
     return val
 
 
+def filled_values(values, fill_value, dtype=None, order="C"):
+    """Return values as a plain array with masked cells set to fill_value.
+
+    The result is written into one preallocated array of the given dtype and
+    memory order (C or F), instead of going through filled() and astype() copies.
+    """
+    data = np.ma.getdata(values)
+    if dtype is None:
+        dtype = data.dtype
+    result = np.empty(data.shape, dtype=dtype, order=order)
+    np.copyto(result, data, casting="unsafe")
+    mask = np.ma.getmask(values)
+    if mask is not ma.nomask:
+        np.copyto(result, fill_value, where=mask, casting="unsafe")
+    return result
+
+
+def undef_mask(values, limit, invalid=True):
+    """Return a C ordered boolean mask, True where values are above limit or invalid.
+
+    Invalid means NaN or infinite for floats, and is only included if invalid is
+    True; otherwise this is as masked_greater(), where +inf is masked but NaN and
+    -inf are not. The mask is built in place in one array, instead of going
+    through masked_greater() and masked_invalid() which both copy the values. Any
+    mask on the input is not included.
+    """
+    data = np.ma.getdata(values)
+    if not invalid:
+        return np.greater(data, limit, order="C")
+    if data.dtype.kind == "f":
+        valid = np.isfinite(data, order="C")
+        np.less_equal(data, limit, out=valid, where=valid)
+    else:
+        valid = np.less_equal(data, limit, order="C")
+    return np.logical_not(valid, out=valid)
+
+
+def active_unique(values, maxcode=65536):
+    """Return the sorted unique active (unmasked) values of an integer array.
+
+    Non-negative values below maxcode, which is the normal case for codes, are
+    counted with bincount in one pass, hence the sorting in np.unique is avoided.
+    """
+    data = np.ma.getdata(values).ravel()
+    mask = np.ma.getmask(values)
+    if mask is not ma.nomask:
+        data = data[~mask.ravel()]
+    if data.size == 0:
+        return data
+
+    if data.min() >= 0 and data.max() < maxcode:
+        return np.flatnonzero(np.bincount(data)).astype(data.dtype)
+    return np.unique(data)
+
+
+def active_stats(values, chunksize=1048576):
+    """Return count, mean, std, min and max of the active (unmasked) values.
+
+    The values are streamed in chunks, and the chunk results are combined (the
+    pairwise algorithm by Chan et al. for the variance). Hence no full size
+    filled or compressed copy of the array is made. If no cells are active, the
+    statistics are returned as masked.
+    """
+    data = np.ma.getdata(values).ravel()
+    mask = np.ma.getmask(values)
+    if mask is not ma.nomask:
+        mask = mask.ravel()
+
+    count = 0
+    mean = m2 = 0.0
+    vmin = vmax = None
+
+    for start in range(0, data.size, chunksize):
+        chunk = data[start : start + chunksize]
+        if mask is not ma.nomask:
+            # fully active chunks are used as is, fully inactive are skipped
+            cmask = mask[start : start + chunksize]
+            if cmask.all():
+                continue
+            if cmask.any():
+                chunk = chunk[~cmask]
+        if chunk.size == 0:
+            continue
+
+        cmin = chunk.min()
+        cmax = chunk.max()
+        chunk = chunk.astype(np.float64)
+        cmean = chunk.mean()
+        cm2 = np.square(chunk - cmean).sum()
+
+        total = count + chunk.size
+        delta = cmean - mean
+        mean += delta * chunk.size / total
+        m2 += cm2 + delta * delta * count * chunk.size / total
+        count = total
+        vmin = cmin if vmin is None else min(vmin, cmin)
+        vmax = cmax if vmax is None else max(vmax, cmax)
+
+    if count == 0:
+        return 0, ma.masked, ma.masked, ma.masked, ma.masked
+
+    return count, mean, np.sqrt(m2 / count), vmin, vmax
+
+
 def update_values_from_carray(self, carray, dtype, delete=False):
     """Transfer values from SWIG 1D carray to numpy, 3D array"""
 
@@ -78,31 +182,20 @@ def update_carray(self, undef=None, discrete=None, dtype=None, order="F"):
         dstatus = bool(discrete)
 
     if undef is None:
-        undef = xtgeo.UNDEF
+        undef = UNDEF
         if dstatus:
-            undef = xtgeo.UNDEF_INT
+            undef = UNDEF_INT
 
     logger.debug("Entering conversion from numpy to C array ...")
 
-    values = self._values.copy()
-
     if not dtype:
-        if dstatus:
-            values = values.astype(np.int32)
-        else:
-            values = values.astype(np.float64)
-    else:
-        values = values.astype(dtype)
-
-    values = ma.filled(values, undef)
-
-    if order == "F":
-        values = np.asfortranarray(values)
-        values1d = np.ravel(values, order="K")
+        dtype = np.int32 if dstatus else np.float64
 
-    if values1d.dtype == "float64" and dstatus and not dtype:
-        values1d = values1d.astype("int32")
-        logger.debug("Casting has been done")
+    if order != "F":
+        order = "C"
+    values1d = filled_values(self._values, undef, dtype=dtype, order=order).ravel(
+        order=order
+    )
 
     if values1d.dtype == "float64":
         logger.debug("Convert to carray (double)")
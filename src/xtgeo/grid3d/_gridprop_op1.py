@@ -87,21 +87,25 @@ def operation_polygons(self, poly, value, opname="add", inside=True):
     if not isinstance(poly, xtgeo.xyz.Polygons):
         raise ValueError("The poly input is not a Polygons instance")
 
-    # make a copy of the array which is used a "filter" or "proxy"
-    # value will be 1 inside polygons, 0 outside. Undef cells are kept as is
-    dtype = self.dtype
-
-    proxy = self.copy()
-    proxy.discrete_to_continuous()
-
-    proxy.values *= 0.0
+    # make an array which is used a "filter" or "proxy"
+    # value will be 1 inside polygons, 0 outside. Undef cells are kept as is.
+    # Only the mask is needed from self, hence no full copy of the property; the
+    # mask is not copied here, as the constructor makes a new mask anyway
+    proxy = xtgeo.grid3d.GridProperty(
+        ncol=self.ncol,
+        nrow=self.nrow,
+        nlay=self.nlay,
+        values=np.ma.array(
+            np.zeros(self.dimensions), mask=np.ma.getmaskarray(self.values)
+        ),
+    )
     cvals = gl.update_carray(proxy)
 
-    idgroups = poly.dataframe.groupby(poly.pname)
+    ids, allpx, allpy, _, offsets = poly._vertex_rings()
 
-    for id_, grp in idgroups:
-        xcor = grp[poly.xname].values
-        ycor = grp[poly.yname].values
+    for id_, start, stop in zip(ids, offsets[:-1], offsets[1:]):
+        xcor = allpx[start:stop]
+        ycor = allpy[start:stop]
 
         ier = _cxtgeo.grd3d_setval_poly(
             xcor,
@@ -120,41 +124,62 @@ def operation_polygons(self, poly, value, opname="add", inside=True):
 
     gl.update_values_from_carray(proxy, cvals, np.float64, delete=True)
 
-    proxyv = proxy.values.astype(np.int8)
-
     proxytarget = 1
     if not inside:
         proxytarget = 0
 
-    if opname == "add":
-        tmp = self.values.copy() + value
-    elif opname == "sub":
-        tmp = self.values.copy() - value
-    elif opname == "mul":
-        tmp = self.values.copy() * value
+    # undefined cells are left as is
+    proxydata, proxymask = proxy._get_data_and_mask()
+    data, mask = self._get_data_and_mask()
+    selected = (proxydata == proxytarget) & ~proxymask & ~mask
+
+    _operation_selected(data, mask, selected, value, opname)
+
+
+_INPLACE_UFUNCS = {"add": np.add, "sub": np.subtract, "mul": np.multiply}
+
+
+def _operation_selected(data, mask, selected, value, opname):
+    """Apply operation on the plain data and mask arrays where selected is True.
+
+    The data and mask arrays are changed in place. If value is a masked array, its
+    mask is transferred to the result (except for division, where masked values
+    are treated as 1).
+
+    The arithmetic is done with ufuncs writing directly into data where selected,
+    so no gathered copies or temporary result arrays are made. The cast back to
+    the current dtype (e.g. integers for discrete properties) is done on the fly.
+    """
+    valuedata = np.ma.getdata(value)
+    valuemask = np.ma.getmask(value)
+
+    if opname in _INPLACE_UFUNCS:
+        _INPLACE_UFUNCS[opname](
+            data, valuedata, out=data, where=selected, casting="unsafe"
+        )
+    elif opname == "set":
+        np.copyto(data, valuedata, where=selected, casting="unsafe")
     elif opname == "div":
         # Dividing a map of zero is always a hazzle; try to obtain 0.0
         # as result in these cases
-        if 0.0 in value:
+        valuedata = np.broadcast_to(valuedata, data.shape)[selected]
+        if valuemask is not np.ma.nomask:
+            valuedata = np.where(
+                np.broadcast_to(valuemask, data.shape)[selected], 1.0, valuedata
+            )
+        if np.any(valuedata == 0.0):
             xtg.warn(
                 "Dividing a surface with value or surface with zero "
                 "elements; may get unexpected results, try to "
                 "achieve zero values as result!"
             )
         with np.errstate(divide="ignore", invalid="ignore"):
-            this = np.ma.filled(self.values, fill_value=1.0)
-            that = np.ma.filled(value, fill_value=1.0)
-            mask = np.ma.getmaskarray(self.values)
-            tmp = np.true_divide(this, that)
-            tmp = np.where(np.isinf(tmp), 0, tmp)
-            tmp = np.nan_to_num(tmp)
-            tmp = np.ma.array(tmp, mask=mask)
-
-    elif opname == "set":
-        tmp = self.values.copy() * 0 + value
-
-    # convert tmp back to correct dtype
-    tmp = tmp.astype(dtype)
-
-    self.values[proxyv == proxytarget] = tmp[proxyv == proxytarget]
-    del tmp
+            result = np.true_divide(data[selected], valuedata)
+            result = np.where(np.isinf(result), 0, result)
+            data[selected] = np.nan_to_num(result)
+        return
+    else:
+        raise ValueError(f"Invalid operation name: {opname}")
+
+    if valuemask is not np.ma.nomask:
+        np.logical_or(mask, valuemask, out=mask, where=selected)
@@ -6,6 +6,7 @@ import numpy.ma as ma
 
 import xtgeo
 from xtgeo.common import XTGeoDialog
+from xtgeo.common.constants import UNDEF, UNDEF_INT, UNDEF_INT_LIMIT, UNDEF_LIMIT
 
 try:
     import roxar  # type: ignore
@@ -81,10 +82,10 @@ def _convert_to_xtgeo_prop(
 
     if result["discrete"]:
         mybuffer = np.ndarray(indexer.dimensions, dtype=np.int32)
-        mybuffer.fill(xtgeo.UNDEF_INT)
+        mybuffer.fill(UNDEF_INT)
     else:
         mybuffer = np.ndarray(indexer.dimensions, dtype=np.float64)
-        mybuffer.fill(xtgeo.UNDEF)
+        mybuffer.fill(UNDEF)
 
     cellno = indexer.get_cell_numbers_in_range((0, 0, 0), indexer.dimensions)
 
@@ -97,9 +98,9 @@ def _convert_to_xtgeo_prop(
     mybuffer[iind, jind, kind] = pvalues[cellno]
 
     if result["discrete"]:
-        mybuffer = ma.masked_greater(mybuffer, xtgeo.UNDEF_INT_LIMIT)
+        mybuffer = ma.masked_greater(mybuffer, UNDEF_INT_LIMIT)
     else:
-        mybuffer = ma.masked_greater(mybuffer, xtgeo.UNDEF_LIMIT)
+        mybuffer = ma.masked_greater(mybuffer, UNDEF_LIMIT)
 
     result["values"] = mybuffer
     result["name"] = pname
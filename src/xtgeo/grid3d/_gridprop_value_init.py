@@ -89,13 +89,45 @@ def initial_gridprop_values_from_scalar(dimensions, value, isdiscrete):
         dtype = np.float64
         if isdiscrete:
             dtype = np.int32
+        if value == 0:
+            # np.zeros is calloc backed, i.e. pages are zeroed lazily
+            return np.ma.zeros(dimensions, dtype=dtype)
+        if not isdiscrete or (
+            isinstance(value, int)
+            and np.iinfo(np.int32).min <= value <= np.iinfo(np.int32).max
+        ):
+            return np.ma.MaskedArray(np.full(dimensions, value, dtype=dtype))
         return np.ma.zeros(dimensions, dtype=dtype) + value
     raise ValueError("Scalar input values of invalid type")
 
 
+def initial_gridprop_values_from_import(dimensions, values, isdiscrete):
+    """Initial gridproperties values from a file import.
+
+    The importers return new arrays, so an array which already is on the right
+    format (masked, dtype, shape and C order) is used as is. Other arrays are
+    copied as for user input.
+    """
+    dtype = np.int32 if isdiscrete else np.float64
+    mask = np.ma.getmask(values)
+    if (
+        isinstance(values, np.ma.MaskedArray)
+        and values.dtype == dtype
+        and values.shape == tuple(dimensions)
+        and values.flags.c_contiguous
+        and (mask is np.ma.nomask or mask.flags.c_contiguous)
+    ):
+        return values
+    return initial_gridprop_values_from_array(dimensions, values, isdiscrete)
+
+
 def initial_gridprop_values_from_array(dimensions, values, isdiscrete):
     """Initial gridproperties values from numpy array"""
-    values = np.ma.MaskedArray(values.reshape(dimensions))
-    if isdiscrete:
-        return values.astype(np.int32)
-    return values.astype(np.float64)
+    # copy data and mask once (C contiguous, also for e.g. transposed input), and
+    # wrap them in a single masked array
+    dtype = np.int32 if isdiscrete else np.float64
+    data = np.array(np.ma.getdata(values), dtype=dtype, order="C")
+    mask = np.ma.getmask(values)
+    if mask is not np.ma.nomask:
+        mask = np.array(mask, order="C").reshape(dimensions)
+    return np.ma.MaskedArray(data.reshape(dimensions), mask=mask, copy=False)
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from typing import List, Tuple, Union
 
 from typing_extensions import Literal
@@ -111,7 +110,7 @@ def import_ecl_init_gridproperties(
             validnames.append(kwname)
 
     if names == "all":
-        usenames = deepcopy(validnames)
+        usenames = list(validnames)
     else:
         usenames = list(names)
 
@@ -199,7 +198,7 @@ def import_ecl_restart_gridproperties(
 
     usenamedatepairs = list()
     if names == "all" and dates == "all":
-        usenamedatepairs = deepcopy(validnamedatepairs)
+        usenamedatepairs = list(validnamedatepairs)
         usedates = dates
     else:
         if names == "all" and dates != "all":
@@ -217,10 +216,11 @@ def import_ecl_restart_gridproperties(
                 usenamedatepairs.append((name, date))
 
     # Do the actual import
+    validnamedateset = set(validnamedatepairs)
     for namedate in usenamedatepairs:
         name, date = namedate
 
-        if name not in ("SGAS", "SOIL", "SWAT") and namedate not in validnamedatepairs:
+        if name not in ("SGAS", "SOIL", "SWAT") and namedate not in validnamedateset:
             # saturation keywords are a mess in Eclipse and friends; check later
             if strictkeycomb:
                 raise ValueError(
@@ -255,21 +255,16 @@ def import_ecl_restart_gridproperties(
 
 def _process_valid_namesdates(kwlist, grid):
     """Return lists with valid pairs, dates scanned from RESTART"""
-    validnamedatepairs = list()
-    validdates = list()
+    # dicts are used as insertion ordered sets for fast lookup
+    validnamedatepairs = dict()
+    validdates = dict()
     valid_lengths = valid_gridprop_lengths(grid)
-    for kw in list(kwlist.itertuples(index=False, name=None)):
-        kwname, kwtyp, nlen, _, date = kw
-        if (
-            kwtyp != "CHAR"
-            and nlen in valid_lengths
-            and (kwname, date) not in validnamedatepairs
-        ):
-            validnamedatepairs.append((kwname, date))
-        if kwtyp != "CHAR" and nlen in valid_lengths and date not in validdates:
-            validdates.append(date)
-
-    return validnamedatepairs, validdates
+    for kwname, kwtyp, nlen, _, date in kwlist.itertuples(index=False, name=None):
+        if kwtyp != "CHAR" and nlen in valid_lengths:
+            validnamedatepairs[(kwname, date)] = None
+            validdates[date] = None
+
+    return list(validnamedatepairs), list(validdates)
 
 
 def _process_sloppydates(dates, validdates):
@@ -8,6 +8,8 @@ import roffio
 
 from xtgeo.common.constants import UNDEF_INT_LIMIT, UNDEF_LIMIT
 
+from ._gridprop_lowlevel import filled_values
+
 
 @dataclass
 class RoffParameter:
@@ -122,15 +124,16 @@ class RoffParameter:
         vals = self.values
         if isinstance(vals, bytes):
             vals = np.ndarray(len(vals), np.uint8, vals)
-        vals = vals.copy()
         vals = np.flip(vals.reshape((self.nx, self.ny, self.nz)), -1)
 
+        # astype() always makes a new C ordered array, so this is the only copy
+        # needed when decoding the (possibly read only) file buffer
         if self.is_discrete:
-            vals = vals.astype(np.int32)
+            vals = vals.astype(np.int32, order="C")
         else:
-            vals = vals.astype(np.float64)
+            vals = vals.astype(np.float64, order="C")
 
-        return np.ma.masked_values(vals, self.undefined_value)
+        return np.ma.masked_values(vals, self.undefined_value, copy=False)
 
     @staticmethod
     def from_xtgeo_grid_property(xtgeo_grid_property):
@@ -155,18 +158,20 @@ class RoffParameter:
             else:
                 values = np.ma.masked_greater(values, UNDEF_LIMIT)
 
+        # roff stores the layers in reverse order, which is flipped on the fly
+        # when filling the output array
         if xtgeo_grid_property.isdiscrete:
-            values = values.astype(np.int32).filled(-999)
+            values = filled_values(np.flip(values, -1), -999, dtype=np.int32)
         else:
             # Although the roff format can contain double,
             # double typed parameters are not read by RMS so we
             # need to convert to float32 here
-            values = values.astype(np.float32).filled(-999.0)
+            values = filled_values(np.flip(values, -1), -999.0, dtype=np.float32)
 
         return RoffParameter(
             *xtgeo_grid_property.dimensions,
             name=xtgeo_grid_property.name,
-            values=np.asarray(np.flip(values, -1).ravel()),
+            values=values.ravel(),
             code_names=code_names,
             code_values=code_values,
         )
@@ -2,12 +2,17 @@
 """Module for a 3D grid property."""
 
 
+import collections
+import concurrent.futures
 import copy
 import functools
 import hashlib
+import importlib
 import io
 import numbers
+import os
 import pathlib
+import threading
 import warnings
 from types import FunctionType
 from typing import Any, Optional, Union
@@ -15,22 +20,10 @@ from typing import Any, Optional, Union
 import numpy as np
 
 import xtgeo
+from xtgeo.common.constants import UNDEF, UNDEF_INT, UNDEF_INT_LIMIT, UNDEF_LIMIT
 
-from . import (
-    _gridprop_export,
-    _gridprop_lowlevel,
-    _gridprop_op1,
-    _gridprop_roxapi,
-    _gridprop_value_init,
-)
+from . import _gridprop_lowlevel, _gridprop_value_init
 from ._grid3d import _Grid3D
-from ._gridprop_import_eclrun import (
-    import_gridprop_from_init,
-    import_gridprop_from_restart,
-)
-from ._gridprop_import_grdecl import import_bgrdecl_prop, import_grdecl_prop
-from ._gridprop_import_roff import import_roff
-from ._gridprop_import_xtgcpprop import import_xtgcpprop
 
 xtg = xtgeo.common.XTGeoDialog()
 logger = xtg.functionlogger(__name__)
@@ -54,37 +47,230 @@ logger = xtg.functionlogger(__name__)
 # ======================================================================================
 # Functions outside the class, for rapid access. Will be exposed as
 # xxx = xtgeo.gridproperty_from_file. pylint: disable=fixme
+#
+# The import, export, roxapi and operation modules are imported where used, so that
+# they are only loaded when a grid property actually is read, written or operated on.
+# pylint: disable=import-outside-toplevel
 # ======================================================================================
 
 
+# Importer (module, function) for each file format; see _data_reader_factory()
+_DATA_READERS = {
+    "roff_binary": ("_gridprop_import_roff", "import_roff"),
+    "roff_ascii": ("_gridprop_import_roff", "import_roff"),
+    "init": ("_gridprop_import_eclrun", "import_gridprop_from_init"),
+    "finit": ("_gridprop_import_eclrun", "import_gridprop_from_init"),
+    "unrst": ("_gridprop_import_eclrun", "import_gridprop_from_restart"),
+    "funrst": ("_gridprop_import_eclrun", "import_gridprop_from_restart"),
+    "grdecl": ("_gridprop_import_grdecl", "import_grdecl_prop"),
+    "bgrdecl": ("_gridprop_import_grdecl", "import_bgrdecl_prop"),
+    "xtg": ("_gridprop_import_xtgcpprop", "import_xtgcpprop"),
+}
+
+
 def _data_reader_factory(fformat):
-    if fformat in ["roff_binary", "roff_ascii"]:
-        return import_roff
-    elif fformat in ["finit", "init"]:
-        return import_gridprop_from_init
+    """Return the import function for a file format; only its module is imported."""
+    try:
+        modname, funcname = _DATA_READERS[fformat]
+    except (KeyError, TypeError):
+        raise ValueError(f"Invalid grid property file format {fformat}") from None
 
-    elif fformat in ["funrst", "unrst"]:
-        return functools.partial(import_gridprop_from_restart, fformat=fformat)
-    elif fformat == "grdecl":
-        return import_grdecl_prop
+    reader = getattr(importlib.import_module("." + modname, __package__), funcname)
+    if fformat in ("unrst", "funrst"):
+        return functools.partial(reader, fformat=fformat)
+    return reader
 
-    elif fformat == "bgrdecl":
-        return import_bgrdecl_prop
 
-    elif fformat in ["xtg"]:
-        return import_xtgcpprop
-    else:
-        raise ValueError(f"Invalid grid property file format {fformat}")
+@functools.lru_cache(maxsize=4096)
+def _detect_fformat_cached(path, mtime_ns, size):
+    """Detect format of a file; the stat arguments make stale entries unreachable."""
+    return xtgeo._XTGeoFile(path).detect_fformat()
+
+
+def _resolve_fformat(mfile, fformat):
+    """Return the file format, detected (memoized for plain files) if not given."""
+    if fformat is not None and fformat != "guess":
+        return mfile.generic_format_by_proposal(fformat.lower())  # default
+
+    if not mfile.memstream:
+        try:
+            stat = os.stat(mfile.file)
+        except (OSError, TypeError):
+            pass
+        else:
+            return _detect_fformat_cached(
+                os.path.abspath(mfile.file), stat.st_mtime_ns, stat.st_size
+            )
+    return mfile.detect_fformat()
+
 
+# Bounded LRU cache of parsed property files, see gridproperty_from_file()
+_GP_CACHE_MAX = 32
+_GP_CACHE = collections.OrderedDict()
+_GP_CACHE_LOCK = threading.Lock()
+# one lock per file import in progress, so a file is read once by concurrent calls
+_GP_CACHE_READING = dict()
 
-def gridproperty_from_file(*args, **kwargs):
+
+def _gridproperty_cache_key(pfile, fformat, kwargs):
+    """Return a cache key for a property file import, or None if not cacheable.
+
+    Only plain files on disk are cached, and the key includes modification time
+    and size so that a rewritten file is parsed again. Imports which depend on a
+    grid instance are not cached.
+    """
+    if not isinstance(pfile, (str, pathlib.Path)):
+        return None
+    if kwargs.get("grid") is not None:
+        return None
+
+    try:
+        stat = os.stat(pfile)
+        key = (
+            os.path.abspath(pfile),
+            stat.st_mtime_ns,
+            stat.st_size,
+            fformat,
+            tuple(sorted(kwargs.items())),
+        )
+        hash(key)
+    except (OSError, TypeError):
+        return None
+    return key
+
+
+def gridproperty_cache_clear():
+    """Clear the import cache of :func:`gridproperty_from_file()`.
+
+    This releases the memory held by the cached property values.
+
+    Example::
+
+        >>> import xtgeo
+        >>> xtgeo.gridproperty_cache_clear()
+    """
+    with _GP_CACHE_LOCK:
+        _GP_CACHE.clear()
+
+
+def _copy_import_result(result):
+    """Return a copy of an import result, not sharing values or codes."""
+    result = dict(result)
+    result["values"] = result["values"].copy()
+    result["codes"] = dict(result.get("codes") or {})
+    return result
+
+
+def _gridproperty_cache_read(key, pfile, fformat, kwargs):
+    """Return an import result for key, from the cache or by reading the file.
+
+    The result is owned by the caller. On a hit it is a copy of the cached result,
+    while on a miss the result as read is returned and a copy is cached.
+    """
+    with _GP_CACHE_LOCK:
+        result = _GP_CACHE.get(key)
+        if result is not None:
+            _GP_CACHE.move_to_end(key)
+            return _copy_import_result(result)
+        reading = _GP_CACHE_READING.setdefault(key, threading.Lock())
+
+    # the file is read outside the cache lock, hence other files can be read
+    # concurrently, while other calls for the same file wait for this read
+    with reading:
+        with _GP_CACHE_LOCK:
+            result = _GP_CACHE.get(key)
+        if result is not None:
+            return _copy_import_result(result)
+
+        try:
+            result = GridProperty._read_file_kwargs(pfile, fformat, **kwargs)
+            with _GP_CACHE_LOCK:
+                _GP_CACHE[key] = _copy_import_result(result)
+                while len(_GP_CACHE) > _GP_CACHE_MAX:
+                    _GP_CACHE.popitem(last=False)
+        finally:
+            with _GP_CACHE_LOCK:
+                if _GP_CACHE_READING.get(key) is reading:
+                    del _GP_CACHE_READING[key]
+    return result
+
+
+def _gridproperty_cache_invalidate(pfile):
+    """Remove any cached imports of the given file, e.g. when it is rewritten."""
+    if not isinstance(pfile, (str, pathlib.Path)):
+        return
+    abspath = os.path.abspath(pfile)
+    with _GP_CACHE_LOCK:
+        for key in [key for key in _GP_CACHE if key[0] == abspath]:
+            del _GP_CACHE[key]
+
+
+def _smallest_discrete_dtype(values):
+    """Return the smallest integer dtype that can hold the active values."""
+    active = np.ma.compressed(values)
+    if active.size == 0:
+        return np.uint8
+    vmin = int(active.min())
+    vmax = int(active.max())
+    for dtype in (np.uint8, np.int16, np.uint16, np.int32):
+        info = np.iinfo(dtype)
+        if info.min <= vmin and vmax <= info.max:
+            return dtype
+    return np.int64
+
+
+def _smallest_continuous_dtype(values):
+    """Return np.float32 if all active values are exact in float32, else np.float64.
+
+    E.g. ROFF and Eclipse files store most continuous properties as float32.
+    """
+    active = np.ma.compressed(values)
+    if np.array_equal(active.astype(np.float32), active):
+        return np.float32
+    return np.float64
+
+
+def _deepcopy_masked_values(values, memo):
+    """Deep copy a masked array by copying data and mask into preallocated arrays."""
+    data = np.empty_like(values.data)
+    np.copyto(data, values.data)
+    mask = np.ma.getmask(values)
+    if mask is not np.ma.nomask:
+        newmask = np.empty_like(mask)
+        np.copyto(newmask, mask)
+        mask = newmask
+
+    result = np.ma.MaskedArray(data, mask=mask, copy=False)
+    result.fill_value = values.fill_value
+    memo[id(values)] = result
+    return result
+
+
+def gridproperty_from_file(pfile, fformat=None, dtype=None, cache=False, **kwargs):
     """Make a GridProperty instance directly from file import.
 
     For arguments, see :func:`GridProperty.from_file()`
 
+    With ``cache=True``, imports of plain files (without a ``grid``) are cached on
+    file path, modification time, size and import arguments; a repeated import of
+    an unchanged file will hence return a fresh copy without reading the file
+    again. Note that the cache keeps a copy of the values of the last 32 cached
+    files in memory for the rest of the process, regardless of their size. Use
+    :func:`gridproperty_cache_clear()` to release the memory.
+
+    For several properties or dates from one Eclipse restart file, use
+    :func:`gridproperties_from_file()` which reads them all in one pass.
+
     Args:
         pfile (str): Property file
-        args: See :func:`GridProperty.from_file()`
+        fformat (str): File format, see :func:`GridProperty.from_file()`
+        dtype: Numpy dtype of the imported values, see :attr:`GridProperty.dtype`.
+            For discrete properties, "auto" will select the smallest integer type
+            that can hold the codes, e.g. np.uint8 for most facies properties.
+            For continuous properties, "auto" will select np.float32 if this
+            holds all values exactly, i.e. half the memory of np.float64.
+            Default is None which keeps the default dtype.
+        cache (bool): If True, use the import cache, see above. Default is False.
         kwargs: See :func:`GridProperty.from_file()`.
 
     Example::
@@ -95,7 +281,63 @@ def gridproperty_from_file(*args, **kwargs):
         ...    name="PORO"
         ... )
     """
-    return GridProperty._read_file(*args, **kwargs)
+    key = _gridproperty_cache_key(pfile, fformat, kwargs) if cache else None
+    if key is None:
+        prop = GridProperty._read_file(pfile, fformat, **kwargs)
+    else:
+        result = _gridproperty_cache_read(key, pfile, fformat, kwargs)
+        prop = GridProperty._from_import(result)
+
+    if isinstance(dtype, str) and dtype == "auto":
+        if prop.isdiscrete:
+            prop.dtype = _smallest_discrete_dtype(prop.values)
+        else:
+            prop.dtype = _smallest_continuous_dtype(prop.values)
+    elif dtype is not None:
+        prop.dtype = dtype
+    return prop
+
+
+def gridproperty_from_files(
+    pfiles, fformat=None, dtype=None, max_workers=None, cache=False, **kwargs
+):
+    """Make a list of GridProperty instances from importing several files at once.
+
+    The files are imported concurrently in a thread pool, which pays off for
+    many files, e.g. the properties of an ensemble of realizations, as the file
+    reading and the numpy conversions are mostly done outside the GIL. The
+    returned list has the same order as the input files.
+
+    Args:
+        pfiles (list): Property files
+        fformat (str): File format, see :func:`GridProperty.from_file()`
+        dtype: Numpy dtype of the imported values, see
+            :func:`gridproperty_from_file()`.
+        max_workers (int): Max number of threads, default is as for
+            :class:`concurrent.futures.ThreadPoolExecutor`.
+        cache (bool): If True, use the import cache of
+            :func:`gridproperty_from_file()`. Default is False.
+        kwargs: See :func:`GridProperty.from_file()`, used for all files.
+
+    Example::
+
+        >>> import xtgeo
+        >>> myporos = xtgeo.gridproperty_from_files(
+        ...    [reek_dir + '/reek_sim_poro.roff'] * 3,
+        ...    name="PORO"
+        ... )
+        >>> len(myporos)
+        3
+
+    """
+
+    def _import(pfile):
+        return gridproperty_from_file(
+            pfile, fformat=fformat, dtype=dtype, cache=cache, **kwargs
+        )
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_import, pfiles))
 
 
 def gridproperty_from_roxar(
@@ -122,6 +364,33 @@ def allow_deprecated_init(func):
     # the construction will then follow the new pattern.
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
+        # Checking if we are doing an initialization
+        # from file and raise a deprecation warning if
+        # we are.
+        file_arg = len(args) >= 1 and isinstance(
+            args[0], (str, pathlib.Path, xtgeo._XTGeoFile)
+        )
+        if "pfile" in kwargs or file_arg:
+            warnings.warn(
+                "Initializing directly from file name is deprecated and will be "
+                "removed in xtgeo version 4.0. Use: "
+                "myprop = xtgeo.gridproperty_from_file('some_name.roff') instead",
+                DeprecationWarning,
+            )
+            pfile = kwargs.pop("pfile") if "pfile" in kwargs else args[0]
+            fformat = kwargs.pop("fformat", None)
+            if file_arg:
+                args = args[min(len(args), 2) :]
+
+            mfile = xtgeo._XTGeoFile(pfile)
+            fformat = _resolve_fformat(mfile, fformat)
+
+            kwargs = _data_reader_factory(fformat)(mfile, *args, **kwargs)
+            kwargs["filesrc"] = mfile.file
+            # same as __init__, but the imported values are used without a copy
+            self._reset_from_import(kwargs)
+            return None
+
         # Check if dummy values are to be used
         if (
             all(param not in kwargs for param in ["values", "ncol", "nrow", "nlay"])
@@ -143,40 +412,6 @@ def allow_deprecated_init(func):
                 ),
                 **kwargs,
             )
-
-        # Checking if we are doing an initialization
-        # from file and raise a deprecation warning if
-        # we are.
-        if "pfile" in kwargs or (
-            len(args) >= 1
-            and isinstance(args[0], (str, pathlib.Path, xtgeo._XTGeoFile))
-        ):
-            pfile = kwargs.get("pfile", args[0])
-            warnings.warn(
-                "Initializing directly from file name is deprecated and will be "
-                "removed in xtgeo version 4.0. Use: "
-                "myprop = xtgeo.gridproperty_from_file('some_name.roff') instead",
-                DeprecationWarning,
-            )
-            fformat = kwargs.get("fformat", None)
-            mfile = xtgeo._XTGeoFile(pfile)
-            if fformat is None or fformat == "guess":
-                fformat = mfile.detect_fformat()
-            else:
-                fformat = mfile.generic_format_by_proposal(fformat)  # default
-
-            if "pfile" in kwargs:
-                del kwargs["pfile"]
-            if "fformat" in kwargs:
-                del kwargs["fformat"]
-            if len(args) >= 1 and isinstance(
-                args[0], (str, pathlib.Path, xtgeo._XTGeoFile)
-            ):
-                args = args[min(len(args), 2) :]
-
-            kwargs = _data_reader_factory(fformat)(mfile, *args, **kwargs)
-            kwargs["filesrc"] = mfile.file
-            return func(self, **kwargs)
         return func(self, *args, **kwargs)
 
     return wrapper
@@ -208,6 +443,27 @@ class GridProperty(_Grid3D):
 
     """
 
+    # known attributes are slots, with the dimensions in the _Grid3D base class;
+    # __dict__ keeps other attributes set by users
+    __slots__ = (
+        "_name",
+        "_date",
+        "_isdiscrete",
+        "_geometry",
+        "_fracture",
+        "_codes",
+        "_dualporo",
+        "_dualperm",
+        "_filesrc",
+        "_roxorigin",
+        "_roxar_dtype",
+        "_values",
+        "_values1d_cache",
+        "_metadata",
+        "__dict__",
+        "__weakref__",
+    )
+
     @allow_deprecated_init
     def __init__(
         self,
@@ -330,6 +586,7 @@ class GridProperty(_Grid3D):
         values: Optional[Union[np.ndarray, float, int]] = None,
         roxorigin: bool = False,
         filesrc: Optional[str] = None,
+        values_from_import: bool = False,
     ):
         """Instantating.
 
@@ -420,13 +677,18 @@ class GridProperty(_Grid3D):
             self.roxar_dtype = roxar_dtype
         self._values = values
 
-        self._undef = xtgeo.UNDEF_INT if discrete else xtgeo.UNDEF
-
         self._set_initial_dimensions(gridlike, (ncol, nrow, nlay))
 
-        self._values = _gridprop_value_init.gridproperty_non_dummy_values(
-            gridlike, self.dimensions, values, discrete
-        )
+        if values_from_import:
+            # the importer owns the values, so no default array nor copy is needed
+            self._values = _gridprop_value_init.initial_gridprop_values_from_import(
+                self.dimensions, values, discrete
+            )
+        else:
+            self._values = _gridprop_value_init.gridproperty_non_dummy_values(
+                gridlike, self.dimensions, values, discrete
+            )
+        self._values1d_cache = None
 
         if isinstance(gridlike, xtgeo.grid3d.Grid):
             if linkgeometry:
@@ -435,7 +697,7 @@ class GridProperty(_Grid3D):
                 self.geometry = gridlike
             gridlike.append_prop(self)
 
-        self._metadata = xtgeo.MetaDataCPProperty()
+        self._metadata = None
 
     def _set_initial_dimensions(self, gridlike, input_dimensions):
         """Sets the initial dimensions either from input, grid or default.
@@ -482,8 +744,56 @@ class GridProperty(_Grid3D):
                 f"mismatching layer dimension given: {nlay} vs {self._nlay}"
             )
 
-    def __del__(self):
-        logger.debug("DELETING property instance %s", self.name)
+    def _slot_items(self):
+        """Yield (name, value) for all slot attributes that are set on the instance.
+
+        Other attributes, which are set by users, are found in vars(self).
+        """
+        for key in _Grid3D.__slots__ + GridProperty.__slots__:
+            if key not in ("__dict__", "__weakref__") and hasattr(self, key):
+                yield key, getattr(self, key)
+
+    def __getstate__(self):
+        # the values1d view is rebuilt on demand, and must not be detached from
+        # the values when unpickled
+        state = dict(self._slot_items())
+        state["_values1d_cache"] = None
+        return vars(self).copy(), state
+
+    def __setstate__(self, state):
+        # pickles from older versions have a single dict, and may have
+        # attributes which are removed
+        userstate = {}
+        if isinstance(state, tuple):
+            userstate, state = state
+        vars(self).update(userstate)
+        for key, val in state.items():
+            if hasattr(type(self), key):
+                setattr(self, key, val)
+
+    def __deepcopy__(self, memo):
+        """Deep copy, where the values and mask are copied into preallocated arrays.
+
+        Other attributes are deep copied as usual, except the values1d view
+        which is rebuilt on demand for the new instance, and the codes which are a
+        flat dict of int and str and hence only need a dict copy.
+        """
+        xprop = self.__class__.__new__(self.__class__)
+        memo[id(self)] = xprop
+
+        for key, val in self._slot_items():
+            if key == "_values1d_cache":
+                val = None
+            elif key == "_values":
+                val = _deepcopy_masked_values(val, memo)
+            elif key == "_codes":
+                val = val.copy()
+            else:
+                val = copy.deepcopy(val, memo)
+            setattr(xprop, key, val)
+        vars(xprop).update(copy.deepcopy(vars(self), memo))
+
+        return xprop
 
     def __repr__(self):
         myrp = (
@@ -505,6 +815,9 @@ class GridProperty(_Grid3D):
     @property
     def metadata(self):
         """Return metadata object instance of type MetaDataRegularSurface."""
+        if self._metadata is None:
+            # made on first use, as few of the properties need it
+            self._metadata = xtgeo.MetaDataCPProperty()
         return self._metadata
 
     @metadata.setter
@@ -533,7 +846,8 @@ class GridProperty(_Grid3D):
     @property
     def nactive(self):
         """int: Returns the number of active cells (read only)."""
-        return len(self.actnum_indices)
+        # not cached, as the mask may be changed in place through values
+        return int(self._values.count())
 
     @property
     def geometry(self):
@@ -556,9 +870,8 @@ class GridProperty(_Grid3D):
         given in 1D, C order (read only).
 
         """
-        actnumv = self.get_actnum()
-        actnumv = np.ravel(actnumv.values)
-        return np.flatnonzero(actnumv)
+        # not cached, as the mask may be changed in place through values
+        return np.flatnonzero(~np.ma.getmaskarray(self._values))
 
     @property
     def isdiscrete(self):
@@ -689,6 +1002,7 @@ class GridProperty(_Grid3D):
         values = self.ensure_correct_values(self.ncol, self.nrow, self.nlay, values)
 
         self._values = values
+        self._values1d_cache = None
 
     @property
     def ntotal(self):
@@ -719,8 +1033,22 @@ class GridProperty(_Grid3D):
 
     @property
     def values1d(self):
-        """Returns a 1D view of values (masked numpy) (read only)."""
-        return self._values.reshape(-1)
+        """Returns a 1D view of values (masked numpy).
+
+        The property itself is read only (it cannot be set), but the returned
+        array is a view, hence changes to its elements are seen in values.
+        """
+        # the view is reused as long as values and its mask are the same objects;
+        # values are made C contiguous when set, so ravel() is a view, not a copy
+        mask = np.ma.getmask(self._values)
+        if mask is np.ma.nomask:
+            return self._values.ravel()
+
+        cached = self._values1d_cache
+        if cached is None or cached[0] is not self._values or cached[1] is not mask:
+            cached = (self._values, mask, self._values.ravel())
+            self._values1d_cache = cached
+        return cached[2]
 
     @property
     def undef(self):
@@ -728,9 +1056,9 @@ class GridProperty(_Grid3D):
         numpy arrays (read only).
         """
         if self._isdiscrete:
-            return xtgeo.UNDEF_INT
+            return UNDEF_INT
 
-        return xtgeo.UNDEF
+        return UNDEF
 
     @property
     def undef_limit(self):
@@ -746,9 +1074,9 @@ class GridProperty(_Grid3D):
 
         """
         if self._isdiscrete:
-            return xtgeo.UNDEF_INT_LIMIT
+            return UNDEF_INT_LIMIT
 
-        return xtgeo.UNDEF_LIMIT
+        return UNDEF_LIMIT
 
     # ==================================================================================
     # Class and special methods
@@ -810,6 +1138,46 @@ class GridProperty(_Grid3D):
 
         """
 
+        shape = (ncol, nrow, nlay)
+        if isinstance(invalues, np.ma.MaskedArray) and invalues.shape == shape:
+            # the common case; no wrapping or reshaping and the current mask is
+            # not needed as a new mask is given
+            values = invalues
+        else:
+            values = self._wrap_and_reshape_values(ncol, nrow, nlay, invalues)
+
+        # the self._isdiscrete property shall win over numpy dtype
+        data = np.ma.getdata(values)
+        dtype = data.dtype
+        if dtype.kind in "iu" and not self._isdiscrete:
+            dtype = np.dtype(np.float64)
+        elif dtype.kind == "f" and self._isdiscrete:
+            dtype = np.dtype(np.int32)
+
+        # replace any undef or nan with mask; the mask is made from the input data
+        # and the data are copied (and cast if needed) once into a C contiguous array,
+        # as the C library expects C contiguous buffers
+        mask = _gridprop_lowlevel.undef_mask(data, self.undef_limit)
+        inmask = np.ma.getmask(values)
+        if inmask is not np.ma.nomask:
+            np.logical_or(mask, inmask, out=mask)
+
+        fill_value = None
+        if dtype == data.dtype:
+            fill_value = values.fill_value
+
+        return np.ma.MaskedArray(
+            np.array(data, dtype=dtype, order="C"),
+            mask=mask,
+            fill_value=fill_value,
+            copy=False,
+        )
+
+    def _wrap_and_reshape_values(self, ncol, nrow, nlay, invalues):
+        """Return scalar or array input as a masked array with shape (ncol, nrow, nlay).
+
+        The current mask is applied if the input is not a masked array.
+        """
         currentmask = None
         if self._values is not None:
             if isinstance(self._values, np.ma.MaskedArray):
@@ -832,25 +1200,20 @@ class GridProperty(_Grid3D):
             except ValueError as emsg:
                 xtg.error("Cannot reshape array: {}".format(emsg))
                 raise
+        return values
 
-        # replace any undef or nan with mask
-        values = np.ma.masked_greater(values, self.undef_limit)
-        values = np.ma.masked_invalid(values)
-
-        if not values.flags.c_contiguous:
-            mask = np.ma.getmaskarray(values)
-            mask = np.asanyarray(mask, order="C")
-            values = np.asanyarray(values, order="C")
-            values = np.ma.array(values, mask=mask, order="C")
-
-        # the self._isdiscrete property shall win over numpy dtype
-        if "int" in str(values.dtype) and not self._isdiscrete:
-            values = values.astype(np.float64)
-
-        if "float" in str(values.dtype) and self._isdiscrete:
-            values = values.astype(np.int32)
+    def _get_data_and_mask(self):
+        """Return the values as a plain data ndarray and a boolean mask ndarray.
 
-        return values
+        Both arrays share memory with the ``values`` masked array, so changes done
+        in place are seen by ``values``. This is for vectorized kernels which shall
+        avoid the overhead of numpy masked arrays.
+        """
+        if np.ma.getmask(self._values) is np.ma.nomask:
+            # the mask must be set on values; getmaskarray() would give a detached
+            # array in this case
+            self._values.mask = False
+        return np.ma.getdata(self._values), np.ma.getmask(self._values)
 
     # ==================================================================================
     # Import and export
@@ -902,30 +1265,48 @@ class GridProperty(_Grid3D):
         .. versionchanged:: 2.8 Added gridlink option, default is True
         """
         pfile = xtgeo._XTGeoFile(pfile)
-        if fformat is None or fformat == "guess":
-            fformat = pfile.detect_fformat()
-        else:
-            fformat = pfile.generic_format_by_proposal(fformat)  # default
+        fformat = _resolve_fformat(pfile, fformat)
         kwargs = _data_reader_factory(fformat)(pfile, **kwargs)
         kwargs["filesrc"] = pfile.file
-        self._reset(**kwargs)
+        self._reset_from_import(kwargs)
         return self
 
+    def _reset_from_import(self, kwargs):
+        """Reset from the keyword arguments given by an importer.
+
+        The imported values array is owned by this instance, so it is used without
+        the copy which is made for values given by the user.
+        """
+        self._reset(**kwargs, values_from_import=True)
+
     @classmethod
-    def _read_file(
-        cls,
+    def _from_import(cls, kwargs):
+        """Return a new instance from the keyword arguments given by an importer."""
+        prop = cls.__new__(cls)
+        prop._reset_from_import(kwargs)
+        return prop
+
+    @staticmethod
+    def _read_file_kwargs(
         pfile: Union[str, pathlib.Path, io.BytesIO, io.StringIO],
         fformat: Optional[str] = None,
         **kwargs,
     ):
+        """Read a property file and return the keyword arguments for __init__."""
         pfile = xtgeo._XTGeoFile(pfile)
-        if fformat is None or fformat == "guess":
-            fformat = pfile.detect_fformat()
-        else:
-            fformat = pfile.generic_format_by_proposal(fformat)  # default
+        fformat = _resolve_fformat(pfile, fformat)
         kwargs = _data_reader_factory(fformat)(pfile, **kwargs)
         kwargs["filesrc"] = pfile.file
-        return cls(**kwargs)
+        return kwargs
+
+    @classmethod
+    def _read_file(
+        cls,
+        pfile: Union[str, pathlib.Path, io.BytesIO, io.StringIO],
+        fformat: Optional[str] = None,
+        **kwargs,
+    ):
+        return cls._from_import(cls._read_file_kwargs(pfile, fformat, **kwargs))
 
     def to_file(
         self, pfile, fformat="roff", name=None, append=False, dtype=None, fmt=None
@@ -962,6 +1343,9 @@ class GridProperty(_Grid3D):
 
         """
 
+        from . import _gridprop_export
+
+        _gridproperty_cache_invalidate(pfile)
         _gridprop_export.to_file(
             self,
             pfile,
@@ -992,6 +1376,7 @@ class GridProperty(_Grid3D):
         .. versionadded:: 2.12  Key `faciescodes` was added
 
         """
+        from . import _gridprop_roxapi
 
         self._reset(
             **_gridprop_roxapi.import_prop_roxapi(
@@ -1003,6 +1388,8 @@ class GridProperty(_Grid3D):
     def _read_roxar(
         cls, projectname, gname, pname, realisation=0, faciescodes=False
     ):  # pragma: no cover
+        from . import _gridprop_roxapi
+
         return cls(
             **_gridprop_roxapi.import_prop_roxapi(
                 projectname, gname, pname, realisation, faciescodes
@@ -1044,6 +1431,8 @@ class GridProperty(_Grid3D):
         .. versionadded:: 2.12 Key `casting` was added
 
         """
+        from . import _gridprop_roxapi
+
         _gridprop_roxapi.export_prop_roxapi(
             self, project, gname, pname, realisation=realisation, casting=casting
         )
@@ -1067,13 +1456,8 @@ class GridProperty(_Grid3D):
         np.set_printoptions(threshold=16)
         dsc.txt("Values", self._values.reshape(-1), self._values.dtype)
         np.set_printoptions(threshold=1000)
-        dsc.txt(
-            "Values, mean, stdev, minimum, maximum",
-            self.values.mean(),
-            self.values.std(),
-            self.values.min(),
-            self.values.max(),
-        )
+        _, mean, std, vmin, vmax = _gridprop_lowlevel.active_stats(self._values)
+        dsc.txt("Values, mean, stdev, minimum, maximum", mean, std, vmin, vmax)
         itemsize = self.values.itemsize
         msize = float(self.values.size * itemsize) / (1024 * 1024 * 1024)
         dsc.txt("Roxar datatype", self.roxar_dtype)
@@ -1103,20 +1487,16 @@ class GridProperty(_Grid3D):
 
         if fill_value is None:
             if self._isdiscrete:
-                fvalue = xtgeo.UNDEF_INT
+                fvalue = UNDEF_INT
                 dtype = np.int32
             else:
-                fvalue = xtgeo.UNDEF
+                fvalue = UNDEF
                 dtype = np.float64
         else:
             fvalue = fill_value
             dtype = np.float64
 
-        val = self.values.copy().astype(dtype)
-        npv3d = np.ma.filled(val, fill_value=fvalue)
-        del val
-
-        return npv3d
+        return _gridprop_lowlevel.filled_values(self._values, fvalue, dtype=dtype)
 
     def get_actnum(self, name="ACTNUM", asmasked=False, mask=None):
         """Return an ACTNUM GridProperty object.
@@ -1144,20 +1524,21 @@ class GridProperty(_Grid3D):
             )
             asmasked = super()._evaluate_mask(mask)
 
-        act = GridProperty(
-            ncol=self._ncol, nrow=self._nrow, nlay=self._nlay, name=name, discrete=True
-        )
-
-        orig = self.values
-        vact = np.ones(self.values.shape)
-        vact[orig.mask] = 0
-
+        # ACTNUM made directly from the mask; it is kept as bool here, as the
+        # constructor makes the int32 copy
+        vact = np.logical_not(np.ma.getmaskarray(self._values))
         if asmasked:
-            vact = np.ma.masked_equal(vact, 0)
+            vact = np.ma.masked_equal(vact, 0, copy=False)
 
-        act.values = vact.astype(np.int32)
-        act.isdiscrete = True
-        act.codes = {0: "0", 1: "1"}
+        act = GridProperty(
+            ncol=self._ncol,
+            nrow=self._nrow,
+            nlay=self._nlay,
+            name=name,
+            discrete=True,
+            values=vact,
+            codes={0: "0", 1: "1"},
+        )
 
         # return the object
         return act
@@ -1181,15 +1562,26 @@ class GridProperty(_Grid3D):
         .. versionadded:: 2.3
         .. versionchanged:: 2.8 Added `fill_value` and `order`
         """
-        vact = self.values1d.copy()
-
-        if order == "F":
-            vact = _gridprop_lowlevel.c2f_order(self, vact)
-
-        if activeonly:
-            return vact.compressed()  # safer than vact[~vact.mask] if no masked
-
-        return vact.filled(fill_value)
+        if not activeonly:
+            dtype = self._values.dtype
+            if dtype.kind in "iu" and not np.isfinite(fill_value):
+                # as from filled(), which is not used as it would need another copy
+                # for F order
+                raise TypeError(f"Cannot convert fill_value {fill_value} to {dtype}")
+            # filled in the requested order, hence ravel() is a view of the copy
+            return _gridprop_lowlevel.filled_values(
+                self._values, fill_value, order=order
+            ).ravel(order=order)
+
+        # compressed() gathers the active cells in one pass; the transposed view
+        # gives the cells in F order
+        values = self._values.T if order == "F" else self._values
+        values = values.compressed()
+
+        # compressed() gives the data as is when no cells are masked
+        if np.may_share_memory(values, self._values):
+            values = values.copy()
+        return values
 
     def copy(self, newname=None):
         """Copy a xtgeo.grid3d.GridProperty() object to another instance.
@@ -1210,31 +1602,49 @@ class GridProperty(_Grid3D):
         if newname is None:
             newname = self.name
 
-        xprop = GridProperty(
-            ncol=self._ncol,
-            nrow=self._nrow,
-            nlay=self._nlay,
-            values=self._values.copy(),
-            name=newname,
-        )
-
-        xprop.geometry = self._geometry
-        xprop.codes = copy.deepcopy(self._codes)
-        xprop.isdiscrete = self._isdiscrete
-        xprop.date = self._date
-        xprop.roxorigin = self._roxorigin
-        xprop.roxar_dtype = self._roxar_dtype
-
-        xprop.filesrc = self._filesrc
+        # the attributes are set directly; going through __init__ and the values
+        # setter would cast the values to float and back again for discrete data
+        xprop = GridProperty.__new__(GridProperty)
+        xprop._ncol = self._ncol
+        xprop._nrow = self._nrow
+        xprop._nlay = self._nlay
+
+        xprop._name = newname
+        xprop._date = self._date
+        xprop._isdiscrete = self._isdiscrete
+        xprop._geometry = self._geometry
+        xprop._fracture = False
+        xprop._codes = self._codes.copy()
+        xprop._dualporo = False
+        xprop._dualperm = False
+        xprop._filesrc = self._filesrc
+        xprop._roxorigin = self._roxorigin
+        xprop._roxar_dtype = self._roxar_dtype
+        xprop._values = self._values.copy()
+        xprop._values1d_cache = None
+        xprop._metadata = None
 
         return xprop
 
     def mask_undef(self):
-        """Make UNDEF values masked."""
-        if self._isdiscrete:
-            self._values = np.ma.masked_greater(self._values, xtgeo.UNDEF_INT_LIMIT)
-        else:
-            self._values = np.ma.masked_greater(self._values, xtgeo.UNDEF_LIMIT)
+        """Make UNDEF values masked.
+
+        Values above :attr:`undef_limit` are masked, while NaN values are not.
+        """
+        # the data are kept as is, only the mask is updated (no copy of data)
+        data = np.ma.getdata(self._values)
+        mask = _gridprop_lowlevel.undef_mask(data, self.undef_limit, invalid=False)
+        currentmask = np.ma.getmask(self._values)
+        if currentmask is not np.ma.nomask:
+            np.logical_or(mask, currentmask, out=mask)
+
+        fill_value = None
+        if isinstance(self._values, np.ma.MaskedArray):
+            fill_value = self._values.fill_value
+        self._values = np.ma.MaskedArray(
+            data, mask=mask, fill_value=fill_value, copy=False
+        )
+        self._values1d_cache = None
 
     def crop(self, spec):
         """Crop a property, see method under grid"""
@@ -1246,9 +1656,8 @@ class GridProperty(_Grid3D):
         self._nrow = jc2 - jc1 + 1
         self._nlay = kc2 - kc1 + 1
 
-        newvalues = self.values.copy()
-
-        self.values = newvalues[ic1 - 1 : ic2, jc1 - 1 : jc2, kc1 - 1 : kc2]
+        # the values setter makes a copy, hence only the cropped region is copied
+        self.values = self._values[ic1 - 1 : ic2, jc1 - 1 : jc2, kc1 - 1 : kc2]
 
     def get_xy_value_lists(self, grid=None, activeonly=True):
         """Get lists of xy coords and values for Webportal format.
@@ -1277,6 +1686,7 @@ class GridProperty(_Grid3D):
 
 
         """
+        from . import _gridprop_op1
 
         clist, vlist = _gridprop_op1.get_xy_value_lists(
             self, grid=grid, mask=activeonly
@@ -1303,31 +1713,23 @@ class GridProperty(_Grid3D):
                 with NaN if undefined
 
         """
-        res = np.zeros(iarr.shape, dtype="float64")
-        res = np.ma.masked_equal(res, 0)  # mask all
-
-        # get indices where defined (note the , after valids)
-        (valids,) = np.where(~np.isnan(iarr))
-
-        iarr = iarr[~np.isnan(iarr)]
-        jarr = jarr[~np.isnan(jarr)]
-        karr = karr[~np.isnan(karr)]
+        valid = ~np.isnan(iarr)
 
         try:
-            res[valids] = self.values[
-                iarr.astype("int") - base,
-                jarr.astype("int") - base,
-                karr.astype("int") - base,
+            gathered = self._values[
+                iarr[valid].astype(np.intp) - base,
+                jarr[valid].astype(np.intp) - base,
+                karr[valid].astype(np.intp) - base,
             ]
-
-            return np.ma.filled(res, fill_value=np.nan)
-
         except IndexError as ier:
             xtg.warn("Error {}, return None".format(ier))
             return None
-        except:  # noqa
-            xtg.warn("Unexpected error")
-            raise
+
+        res = np.full(iarr.shape, np.nan, dtype=np.float64)
+        res[valid] = np.where(
+            np.ma.getmaskarray(gathered), np.nan, np.ma.getdata(gathered)
+        )
+        return res
 
     def discrete_to_continuous(self):
         """Convert from discrete to continuous values"""
@@ -1337,6 +1739,7 @@ class GridProperty(_Grid3D):
             val = self._values.copy()
             val = val.astype("float64")
             self._values = val
+            self._values1d_cache = None
             self._isdiscrete = False
             self._codes = {}
             self._roxar_dtype = np.float32
@@ -1348,16 +1751,15 @@ class GridProperty(_Grid3D):
 
         if not self.isdiscrete:
             logger.info("Converting to discrete ...")
-            val = self._values.copy()
-            val = val.astype(np.int32)
+            # astype gives a new array, no need for an extra copy
+            val = self._values.astype(np.int32)
             self._values = val
+            self._values1d_cache = None
             self._isdiscrete = True
 
-            # make the code list
-            uniq = np.unique(val).tolist()
-            codes = dict(zip(uniq, uniq))
-            codes = {k: str(v) for k, v in codes.items()}  # val as strings
-            self._codes = codes
+            # make the code list from the active cells
+            uniq = _gridprop_lowlevel.active_unique(val).tolist()
+            self._codes = {code: str(code) for code in uniq}  # val as strings
             self._roxar_dtype = np.uint16
         else:
             logger.info("No need to convert, already discrete")
@@ -1390,6 +1792,8 @@ class GridProperty(_Grid3D):
             xtg.warnuser(msg)
             raise ValueError("The geometry attribute is not set")
 
+        from . import _gridprop_op1
+
         _gridprop_op1.operation_polygons(
             self, poly, value, opname=opname, inside=inside
         )
@@ -474,11 +474,11 @@ def operation_polygons(self, poly, value, opname="add", inside=True):
         # turn scalar value into numpy array
         value = self.values.copy() * 0 + value
 
-    idgroups = poly.dataframe.groupby(poly.pname)
+    _, allpx, allpy, _, offsets = poly._vertex_rings()
 
-    for _, grp in idgroups:
-        xcor = grp[poly.xname].values
-        ycor = grp[poly.yname].values
+    for start, stop in zip(offsets[:-1], offsets[1:]):
+        xcor = allpx[start:stop]
+        ycor = allpy[start:stop]
 
         ier = _cxtgeo.surf_setval_poly(
             proxy.xori,
@@ -2,13 +2,13 @@
 """XTGeo XYZ module (abstract base class)"""
 from abc import ABC, abstractmethod
 
+import numpy as np
 import pandas as pd
 from xtgeo.common import XTGDescription, XTGeoDialog
 
 from . import _xyz_oper
 
 xtg = XTGeoDialog()
-logger = xtg.functionlogger(__name__)
 
 
 class XYZ(ABC):
@@ -39,17 +39,6 @@ class XYZ(ABC):
         self._yname = yname
         self._zname = zname
 
-    def _reset(
-        self,
-        xname: str = "X_UTME",
-        yname: str = "Y_UTMN",
-        zname: str = "Z_TVDSS",
-    ):
-        """Used in deprecated methods."""
-        self._xname = xname
-        self._yname = yname
-        self._zname = zname
-
     @property
     def xname(self):
         """Returns or set the name of the X column."""
@@ -89,14 +78,30 @@ class XYZ(ABC):
     @property
     def nrow(self):
         """Returns the Pandas dataframe object number of rows."""
-        if self.dataframe is None:
+        dataframe = self.dataframe
+        if dataframe is None:
             return 0
-        return len(self.dataframe.index)
+        return dataframe.shape[0]
+
+    def _xyz_arrays(self):
+        """Return the X, Y and Z columns as contiguous float64 numpy arrays.
+
+        The arrays are views of the dataframe columns when these already are
+        float64, which is the normal case, so no copies are made. Numerical code
+        should use these instead of looking up the dataframe columns repeatedly.
+        """
+        dfr = self.dataframe
+        return tuple(
+            np.ascontiguousarray(dfr[name].to_numpy(), dtype=np.float64)
+            for name in (self._xname, self._yname, self._zname)
+        )
 
     def _df_column_rename(self, newname, oldname):
         if isinstance(newname, str):
             if oldname and self.dataframe is not None:
-                self.dataframe.rename(columns={oldname: newname}, inplace=True)
+                # relabel the columns index only; rename() would copy the data
+                columns = self.dataframe.columns
+                self.dataframe.columns = columns.where(columns != oldname, newname)
         else:
             raise ValueError(f"Wrong type of input to {newname}; must be string")
 
@@ -104,10 +109,11 @@ class XYZ(ABC):
         if not isinstance(value, str):
             raise ValueError(f"Wrong type of input; must be string, was {type(value)}")
 
-        if value not in self.dataframe.columns:
+        columns = self.dataframe.columns
+        if value not in columns:
             raise ValueError(
                 f"{value} does not exist as a column name, must be "
-                f"one of: f{self.dataframe.columns}"
+                f"one of: {list(columns)}"
             )
 
     @abstractmethod
@@ -218,20 +224,27 @@ class XYZ(ABC):
 
         .. versionadded:: 2.1
         """
+        protected = frozenset(self.protected_columns())
+        columns = self.dataframe.columns
+        to_drop = []
         for cname in clist:
-            if cname in self.protected_columns():
+            if cname in protected:
                 xtg.warnuser(
                     f"The column {cname} is protected and will not be deleted."
                 )
                 continue
 
-            if cname not in self.dataframe:
+            if cname not in columns:
                 if strict:
                     raise ValueError(f"The column {cname} is not present.")
                 else:
                     xtg.warnuser(f"Trying to delete {cname}, but it is not present.")
-            else:
-                self.dataframe.drop(cname, axis=1, inplace=True)
+            elif cname not in to_drop:
+                to_drop.append(cname)
+
+        # one drop for all columns, as each drop rebuilds the dataframe
+        if to_drop:
+            self.dataframe.drop(columns=to_drop, inplace=True)
 
     def operation_polygons(self, poly, value, opname="add", inside=True):
         """A generic function for operations restricted to inside or outside polygon(s).
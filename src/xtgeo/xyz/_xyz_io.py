@@ -221,11 +221,18 @@ def to_file(
         return ncount
 
     if fformat is None or fformat in ["xyz", "poi", "pol"]:
-        # NB! reuse export_rms_attr function, but no attributes
-        # are possible
-        ncount = export_rms_attr(
-            xyz, pfile.name, attributes=False, pfilter=pfilter, ispolygons=ispolygons
-        )
+        if not pfilter and not ispolygons and _has_float_xyz(xyz):
+            ncount = export_xyz(xyz, pfile.name)
+        else:
+            # NB! reuse export_rms_attr function, but no attributes
+            # are possible
+            ncount = export_rms_attr(
+                xyz,
+                pfile.name,
+                attributes=False,
+                pfilter=pfilter,
+                ispolygons=ispolygons,
+            )
 
     elif fformat == "rms_attr":
         ncount = export_rms_attr(
@@ -247,6 +254,41 @@ def to_file(
     return ncount
 
 
+def _has_float_xyz(self):
+    """Return True if the X, Y and Z columns all have a float dtype."""
+    dtypes = self.dataframe.dtypes
+    return all(
+        dtypes[name].kind == "f" for name in (self._xname, self._yname, self._zname)
+    )
+
+
+def export_xyz(self, pfile, chunksize=65536):
+    """Export the X, Y and Z float columns to a plain XYZ file.
+
+    The file content is the same as from export_rms_attr without attributes and
+    filter, but the columns are formatted directly in chunks, instead of via a
+    copy of the dataframe and to_csv.
+
+    Returns:
+        The number of values exported. If value is 0; then no file
+        is made.
+    """
+    nrow = self.nrow
+    if nrow == 0:
+        logger.warning("Nothing to export")
+        return 0
+
+    xyzvalues = np.column_stack(self._xyz_arrays())
+    xyzvalues[np.isnan(xyzvalues)] = 999.0
+
+    with open(pfile, "w") as fout:
+        for start in range(0, nrow, chunksize):
+            chunk = xyzvalues[start : start + chunksize]
+            fout.write(("%.3f %.3f %.3f\n" * chunk.shape[0]) % tuple(chunk.ravel()))
+
+    return nrow
+
+
 def export_rms_attr(self, pfile, attributes=True, pfilter=None, ispolygons=False):
     """Export til RMS attribute, also called RMS extended set.
 
@@ -263,7 +305,7 @@ def export_rms_attr(self, pfile, attributes=True, pfilter=None, ispolygons=False
 
     df = self.dataframe.copy()
 
-    if not df.index.any():
+    if df.empty:
         logger.warning("Nothing to export")
         return 0
 
@@ -362,7 +404,7 @@ def export_rms_wpicks(self, pfile, hcolumn, wcolumn, mdcolumn="M_MDEPTH"):
 
     df = self.dataframe.copy()
 
-    if not df.index.any():
+    if df.empty:
         logger.warning("Nothing to export")
         return 0
 
@@ -385,7 +427,7 @@ def export_rms_wpicks(self, pfile, hcolumn, wcolumn, mdcolumn="M_MDEPTH"):
     else:
         columns += [self._xname, self._yname, self._zname]
 
-    if not df.index.any():
+    if df.empty:
         logger.warning("Nothing to export")
         return 0
 
@@ -448,34 +490,34 @@ def _from_list_like(plist, zname, attrs, is_polygons) -> pd.DataFrame:
             raise ValueError("Input numpy array must two-dimensional")
         totnum = plist.shape[1]
         lenattrs = len(attrs) if attrs is not None else 0
-        attr_first_col = 3
         if totnum == 3 + lenattrs:
-            dfr = pd.DataFrame(plist[:, :3], columns=["X_UTME", "Y_UTMN", zname])
-            dfr = dfr.astype(float)
-            if is_polygons:
-                # pname column is missing but assign 0 as ID
-                dfr["POLY_ID"] = 0
-
+            attr_first_col = 3
         elif totnum == 4 + lenattrs and is_polygons:
-            dfr = pd.DataFrame(
-                plist[:, :4],
-                columns=["X_UTME", "Y_UTMN", zname, "POLY_ID"],
-            )
             attr_first_col = 4
         else:
             raise ValueError(
                 f"Wrong length detected of row: {totnum}. "
                 "Are attributes set correct?"
             )
-        dfr.dropna()
-        dfr = dfr.astype(np.float64)
+
+        # the dataframe is made from typed columns in one go, instead of converting
+        # the whole dataframe several times (and once more per attribute)
+        columns = {
+            name: plist[:, icol].astype(np.float64)
+            for icol, name in enumerate(["X_UTME", "Y_UTMN", zname])
+        }
         if is_polygons:
-            dfr["POLY_ID"] = dfr["POLY_ID"].astype(np.int32)
+            if attr_first_col == 4:
+                columns["POLY_ID"] = plist[:, 3].astype(np.float64).astype(np.int32)
+            else:
+                # pname column is missing but assign 0 as ID
+                columns["POLY_ID"] = np.zeros(len(plist), dtype=np.int32)
 
         if lenattrs > 0:
             for enum, (key, dtype) in enumerate(attrs.items()):
-                dfr[key] = plist[:, attr_first_col + enum]
-                dfr = dfr.astype({key: dtype})
+                columns[key] = pd.Series(plist[:, attr_first_col + enum]).astype(dtype)
+
+        dfr = pd.DataFrame(columns)
 
     else:
         raise TypeError("Not possible to make XYZ from given input")
@@ -3,13 +3,8 @@
 
 
 import numpy as np
-from xtgeo.common import XTGeoDialog
 import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 
-xtg = XTGeoDialog()
-
-logger = xtg.functionlogger(__name__)
-
 
 def convert_np_carr_int(xyz, np_array):  # pragma: no cover
     """Convert numpy 1D array to C array, assuming int type."""
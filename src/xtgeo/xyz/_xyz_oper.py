@@ -2,9 +2,12 @@
 """Various operations on XYZ data"""
 
 
+from collections import namedtuple
+
 import numpy as np
 import pandas as pd
 from scipy.interpolate import interp1d, UnivariateSpline
+from scipy.spatial import cKDTree
 
 import shapely.geometry as sg
 
@@ -35,6 +38,7 @@ def operation_polygons(self, poly, value, opname="add", inside=True, where=True)
     logger.warning("Where is not imeplented: %s", where)
 
     oper = {"set": 1, "add": 2, "sub": 3, "mul": 4, "div": 5, "eli": 11}
+    opcode = oper[opname]
 
     insidevalue = 0
     if inside:
@@ -44,34 +48,86 @@ def operation_polygons(self, poly, value, opname="add", inside=True, where=True)
     if not isinstance(poly, xtgeo.xyz.Polygons):
         raise ValueError("The poly input is not a Polygons instance")
 
-    idgroups = poly.dataframe.groupby(poly.pname)
+    ids, allpx, allpy, allpz, offsets = poly._vertex_rings()
 
-    xcor = self.dataframe[self.xname].values
-    ycor = self.dataframe[self.yname].values
-    zcor = self.dataframe[self.zname].values
+    xcor, ycor, zcor = self._xyz_arrays()
 
     usepoly = False
     if isinstance(value, str) and value == "poly":
         usepoly = True
 
-    for id_, grp in idgroups:
-        pxcor = grp[poly.xname].values
-        pycor = grp[poly.yname].values
+    # with many polygons, the points near each polygon are looked up in a tree,
+    # instead of testing all points against the bounding box of every polygon
+    tree = None
+    if inside and _use_point_tree(xcor, ycor, ids.size):
+        tree = cKDTree(np.column_stack((xcor, ycor)))
+
+    for id_, start, stop in zip(ids, offsets[:-1], offsets[1:]):
+        pxcor = allpx[start:stop]
+        pycor = allpy[start:stop]
         pvalue = value
         if usepoly:
-            pvalue = grp[poly.zname].values.mean()
+            pvalue = allpz[start:stop].mean()
         else:
             pvalue = value
 
+        if xcor.size > 0 and not _is_closed(pxcor, pycor):
+            raise RuntimeError("Something went wrong, code 1")
+
+        # points outside the bounding box of the polygon are outside the polygon,
+        # hence the exact (and costly) test in C is only done for the points
+        # within the box
+        if tree is not None:
+            candidates = _points_in_box(tree, xcor, ycor, pxcor, pycor)
+        else:
+            inbox = (
+                (xcor >= pxcor.min())
+                & (xcor <= pxcor.max())
+                & (ycor >= pycor.min())
+                & (ycor <= pycor.max())
+            )
+            if not inside:
+                # points with undefined coordinates are neither inside nor outside,
+                # and are left as is (as in the C code)
+                outbox = ~inbox & np.isfinite(xcor) & np.isfinite(ycor)
+                zcor[outbox] = _operation_values(zcor[outbox], pvalue, opname)
+            candidates = np.flatnonzero(inbox)
+
+        # for many points, most are classified by a coarse raster of the polygon
+        # and only the points close to the polygon edges need the exact test
+        raster = None
+        ngrid = _raster_size(candidates.size)
+        if ngrid:
+            raster = _cached_polygon_raster(poly, id_, pxcor, pycor, ngrid)
+        if raster is not None:
+            status = raster.status[
+                _raster_cells(raster, xcor[candidates], ycor[candidates])
+            ]
+            hit = candidates[status == insidevalue]
+            zcor[hit] = _operation_values(zcor[hit], pvalue, opname)
+            candidates = candidates[status == _BOUNDARY]
+
+        if candidates.size == 0:
+            continue
+
         logger.info("C function for polygon %s...", id_)
 
+        zcand = zcor[candidates]
         ies = _cxtgeo.pol_do_points_inside(
-            xcor, ycor, zcor, pxcor, pycor, pvalue, oper[opname], insidevalue
+            xcor[candidates],
+            ycor[candidates],
+            zcand,
+            pxcor,
+            pycor,
+            pvalue,
+            opcode,
+            insidevalue,
         )
         logger.info("C function for polygon %s... done", id_)
 
         if ies != 0:
             raise RuntimeError("Something went wrong, code {}".format(ies))
+        zcor[candidates] = zcand
 
     zcor[zcor > xtgeo.UNDEF_LIMIT] = np.nan
     self.dataframe[self.zname] = zcor
@@ -81,6 +137,166 @@ def operation_polygons(self, poly, value, opname="add", inside=True, where=True)
     logger.info("Operations of points inside polygon(s)... done")
 
 
+def _is_closed(pxcor, pycor, eps=1.0e-5):
+    """Check that first and last polygon points are equal, as done in the C code."""
+    return abs(pxcor[0] - pxcor[-1]) < eps and abs(pycor[0] - pycor[-1]) < eps
+
+
+# raster status of cells crossed by polygon edges, where the exact test is needed
+_BOUNDARY = -2
+
+
+def _use_point_tree(xcor, ycor, npolys, minpolys=256, minpoints=1024):
+    """Return True if a tree of the points pays off for the number of polygons."""
+    return (
+        npolys >= minpolys
+        and xcor.size >= minpoints
+        and np.isfinite(xcor).all()
+        and np.isfinite(ycor).all()
+    )
+
+
+def _points_in_box(tree, xcor, ycor, pxcor, pycor):
+    """Return the sorted indices of the points in the polygon bounding box.
+
+    The tree gives the points within the circle around the box, which are then
+    filtered on the box itself.
+    """
+    xmin, xmax = pxcor.min(), pxcor.max()
+    ymin, ymax = pycor.min(), pycor.max()
+    centre = (0.5 * (xmin + xmax), 0.5 * (ymin + ymax))
+    # slightly enlarged, so rounding does not drop points at the box corners
+    radius = 0.5 * np.hypot(xmax - xmin, ymax - ymin) * (1.0 + 1.0e-6) + 1.0e-6
+
+    near = np.sort(np.asarray(tree.query_ball_point(centre, radius), dtype=np.int64))
+    inbox = (
+        (xcor[near] >= xmin)
+        & (xcor[near] <= xmax)
+        & (ycor[near] >= ymin)
+        & (ycor[near] <= ymax)
+    )
+    return near[inbox]
+
+
+def _exact_status(xcor, ycor, pxcor, pycor):
+    """Return 1 (inside or on edge), 0 (outside) or -1 (undetermined) per point."""
+    status = np.zeros(xcor.size)
+    _cxtgeo.pol_do_points_inside(xcor, ycor, status, pxcor, pycor, 1.0, 1, 1)
+    status = status.astype(np.int8)
+
+    # only points not inside need the second test (for outside), which is needed
+    # as the C code may also return undetermined
+    rest = np.flatnonzero(status == 0)
+    isout = np.zeros(rest.size)
+    _cxtgeo.pol_do_points_inside(xcor[rest], ycor[rest], isout, pxcor, pycor, 1.0, 1, 0)
+    status[rest[isout != 1.0]] = -1
+    return status
+
+
+_PolygonRaster = namedtuple(
+    "_PolygonRaster", ["pxcor", "pycor", "xmin", "ymin", "xinc", "yinc", "status"]
+)
+
+
+def _raster_size(npoints, minpoints=1024, maxgrid=256):
+    """Return the raster size (a power of 2) for the number of points, or 0 if
+    there are too few points to gain from a raster."""
+    if npoints < minpoints:
+        return 0
+    return min(2 ** int(np.log2(np.sqrt(npoints / 16))), maxgrid)
+
+
+def _polygon_raster(pxcor, pycor, ngrid):
+    """Make a coarse raster of a closed polygon.
+
+    The polygon bounding box is divided into ngrid x ngrid cells. Cells crossed by
+    a polygon edge, and their neighbours, are boundary cells. Every other cell is
+    either fully inside or fully outside the polygon, which is found by an exact
+    test of the cell center only. None is returned for a polygon without area.
+    """
+    xmin, xmax = pxcor.min(), pxcor.max()
+    ymin, ymax = pycor.min(), pycor.max()
+    if xmax <= xmin or ymax <= ymin:
+        return None
+
+    xinc = (xmax - xmin) / ngrid
+    yinc = (ymax - ymin) / ngrid
+    status = np.full((ngrid, ngrid), _BOUNDARY, dtype=np.int8)
+    raster = _PolygonRaster(pxcor.copy(), pycor.copy(), xmin, ymin, xinc, yinc, status)
+
+    # sample the edges with steps of at most half a cell, then a cell crossed
+    # by an edge is either a sampled cell or a neighbour of one
+    dxs = np.diff(pxcor)
+    dys = np.diff(pycor)
+    nsamples = np.ceil(2 * np.maximum(abs(dxs) / xinc, abs(dys) / yinc)) + 2
+    nsamples = nsamples.astype(np.int64)
+    edge = np.repeat(np.arange(dxs.size), nsamples)
+    step = np.arange(edge.size) - np.repeat(np.cumsum(nsamples) - nsamples, nsamples)
+    frac = step / (nsamples[edge] - 1)
+    icol, irow = _raster_cells(
+        raster, pxcor[edge] + frac * dxs[edge], pycor[edge] + frac * dys[edge]
+    )
+
+    crossed = np.zeros((ngrid + 2, ngrid + 2), dtype=bool)
+    crossed[icol + 1, irow + 1] = True
+    boundary = np.zeros((ngrid, ngrid), dtype=bool)
+    for di in range(3):
+        for dj in range(3):
+            boundary |= crossed[di : di + ngrid, dj : dj + ngrid]
+
+    icol, irow = np.nonzero(~boundary)
+    status[icol, irow] = _exact_status(
+        xmin + (icol + 0.5) * xinc, ymin + (irow + 0.5) * yinc, pxcor, pycor
+    )
+    return raster
+
+
+def _raster_cells(raster, xcor, ycor):
+    """Return the raster cell indices of points, clipped to the raster."""
+    ngrid = raster.status.shape[0]
+    icol = np.clip(((xcor - raster.xmin) / raster.xinc).astype(np.int64), 0, ngrid - 1)
+    irow = np.clip(((ycor - raster.ymin) / raster.yinc).astype(np.int64), 0, ngrid - 1)
+    return icol, irow
+
+
+def _cached_polygon_raster(poly, key, pxcor, pycor, ngrid):
+    """Return the raster of one polygon in poly, reusing the one made in a previous
+    operation if the polygon vertices and raster size are unchanged.
+
+    The vertices are compared, instead of relying on invalidation, as the polygons
+    dataframe may be modified in place.
+    """
+    raster = poly._raster_cache.get(key)
+    if (
+        raster is None
+        or raster.status.shape[0] != ngrid
+        or not np.array_equal(raster.pxcor, pxcor)
+        or not np.array_equal(raster.pycor, pycor)
+    ):
+        raster = _polygon_raster(pxcor, pycor, ngrid)
+        poly._raster_cache[key] = raster
+    return raster
+
+
+def _operation_values(zvalues, value, opname):
+    """Return the result of an operation on Z values, as done in the C code."""
+    if opname == "set":
+        return np.full_like(zvalues, value)
+    if opname == "add":
+        return zvalues + value
+    if opname == "sub":
+        return zvalues - value
+    if opname == "mul":
+        return zvalues * value
+    if opname == "div":
+        if abs(value) < 1.0e-5:
+            return np.full_like(zvalues, xtgeo.UNDEF)
+        return zvalues / value
+    if opname == "eli":
+        return np.full_like(zvalues, xtgeo.UNDEF)
+    raise RuntimeError("Something went wrong, code 2")
+
+
 def rescale_polygons(self, distance=10, addlen=False, kind="simple", mode2d=False):
     """Rescale (resample) a polygons segment
     Default settings will make it backwards compatible with 2.0
@@ -312,11 +528,12 @@ def snap_surface(self, surf, activeonly=True):
     if not isinstance(surf, xtgeo.RegularSurface):
         raise ValueError("Input object of wrong data type, must be RegularSurface")
 
-    zval = self.dataframe[self.zname].values.copy()
+    xcor, ycor, zcor = self._xyz_arrays()
+    zval = zcor.copy()
 
     ier = _cxtgeo.surf_get_zv_from_xyv(
-        self.dataframe[self.xname].values,
-        self.dataframe[self.yname].values,
+        xcor,
+        ycor,
         zval,
         surf.ncol,
         surf.nrow,
@@ -339,10 +556,7 @@ def snap_surface(self, surf, activeonly=True):
         self.dataframe = self.dataframe[self.dataframe[self.zname] < xtgeo.UNDEF_LIMIT]
         self.dataframe.reset_index(inplace=True, drop=True)
     else:
-        out = np.where(
-            zval < xtgeo.UNDEF_LIMIT, zval, self.dataframe[self.zname].values
-        )
-        self.dataframe[self.zname] = out
+        self.dataframe[self.zname] = np.where(zval < xtgeo.UNDEF_LIMIT, zval, zcor)
 
 
 def hlen(self, hname="H_CUMLEN", dhname="H_DELTALEN", atindex=0):
@@ -5,31 +5,31 @@ import io
 import pathlib
 import warnings
 from collections import OrderedDict
-from copy import deepcopy
 from typing import Any, Dict, List, Optional, Union
 
 import deprecation
 import numpy as np
 import pandas as pd
 import xtgeo
-from xtgeo.common import XTGeoDialog, inherit_docstring
+from xtgeo.common import inherit_docstring
 from xtgeo.xyz import _xyz_io, _xyz_roxapi
 
 from . import _xyz_oper
 from ._xyz import XYZ
 
-xtg = XTGeoDialog()
-logger = xtg.functionlogger(__name__)
+
+_DATA_READERS = {
+    "xyz": _xyz_io.import_xyz,
+    "zmap_ascii": _xyz_io.import_zmap,
+    "rms_attr": _xyz_io.import_rms_attr,
+}
 
 
 def _data_reader_factory(file_format):
-    if file_format == "xyz":
-        return _xyz_io.import_xyz
-    if file_format == "zmap_ascii":
-        return _xyz_io.import_zmap
-    if file_format == "rms_attr":
-        return _xyz_io.import_rms_attr
-    raise ValueError(f"Unknown file format {file_format}")
+    try:
+        return _DATA_READERS[file_format]
+    except KeyError:
+        raise ValueError(f"Unknown file format {file_format}") from None
 
 
 def _file_importer(
@@ -505,9 +505,11 @@ class Points(XYZ):  # pylint: disable=too-many-public-methods, function-redefine
         zname: str = "Z_TVDSS",
         attributes: Optional[dict] = None,
         filesrc: str = None,
-    ):  # pylint: disable=arguments-differ
+    ):
         """Used in deprecated methods."""
-        super()._reset(xname, yname, zname)
+        self._xname = xname
+        self._yname = yname
+        self._zname = zname
 
         self._attrs = attributes if attributes is not None else dict()
         self._filesrc = filesrc
@@ -579,7 +581,7 @@ class Points(XYZ):  # pylint: disable=too-many-public-methods, function-redefine
 
     @dataframe.setter
     def dataframe(self, df):
-        self._df = df.apply(deepcopy)
+        self._df = df.copy()
 
     def _random(self, nrandom=10):
         """Generate nrandom random points within the range 0..1
@@ -928,7 +930,7 @@ class Points(XYZ):  # pylint: disable=too-many-public-methods, function-redefine
     def copy(self):
         """Returns a deep copy of an instance."""
         mycopy = self.__class__()
-        mycopy._df = self._df.apply(deepcopy)
+        mycopy._df = self._df.copy()
         mycopy._xname = self._xname
         mycopy._yname = self._yname
         mycopy._zname = self._zname
@@ -7,7 +7,6 @@ import functools
 import io
 import pathlib
 import warnings
-from copy import deepcopy
 from typing import Any, List, Optional, Union
 
 import deprecation
@@ -15,23 +14,28 @@ import numpy as np
 import pandas as pd
 import shapely.geometry as sg
 import xtgeo
-from xtgeo.common import inherit_docstring
+from xtgeo.common import XTGeoDialog, inherit_docstring
 from xtgeo.xyz import _xyz_io, _xyz_roxapi
 
 from . import _xyz_oper
 from ._xyz import XYZ
 from ._xyz_io import _convert_idbased_xyz
 
-xtg = xtgeo.common.XTGeoDialog()
+xtg = XTGeoDialog()
 logger = xtg.functionlogger(__name__)
 
 
+_DATA_READERS = {
+    "xyz": _xyz_io.import_xyz,
+    "zmap_ascii": _xyz_io.import_zmap,
+}
+
+
 def _data_reader_factory(file_format):
-    if file_format == "xyz":
-        return _xyz_io.import_xyz
-    if file_format == "zmap_ascii":
-        return _xyz_io.import_zmap
-    raise ValueError(f"Unknown file format {file_format}")
+    try:
+        return _DATA_READERS[file_format]
+    except KeyError:
+        raise ValueError(f"Unknown file format {file_format}") from None
 
 
 def _file_importer(
@@ -326,10 +330,12 @@ class Polygons(XYZ):  # pylint: disable=too-many-public-methods
         dtname: str = "T_DELTALEN",
         name: str = "poly",
         attributes: Optional[dict] = None,
-    ):  # pylint: disable=arguments-differ
+    ):
         """Used in deprecated methods."""
 
-        super()._reset(xname, yname, zname)
+        self._xname = xname
+        self._yname = yname
+        self._zname = zname
         # additonal state properties for Polygons
         self._pname = pname
 
@@ -338,6 +344,8 @@ class Polygons(XYZ):  # pylint: disable=too-many-public-methods
         self._tname = tname
         self._dtname = dtname
         self._name = name
+        # polygon rasters kept between point operations, see _xyz_oper
+        self._raster_cache = {}
 
         if not isinstance(values, pd.DataFrame):
             self._df = _xyz_io._from_list_like(values, self._zname, attributes, True)
@@ -425,7 +433,7 @@ class Polygons(XYZ):  # pylint: disable=too-many-public-methods
 
     @dataframe.setter
     def dataframe(self, df):
-        self._df = df.apply(deepcopy)
+        self._df = df.copy()
         self._name_to_none_if_missing()
 
     def _name_to_none_if_missing(self):
@@ -438,6 +446,34 @@ class Polygons(XYZ):  # pylint: disable=too-many-public-methods
         if self._hname not in self._df.columns:
             self._hname = None
 
+    def _vertex_rings(self):
+        """Return the vertices as contiguous float64 arrays, sorted on polygon id.
+
+        Returns (ids, xcor, ycor, zcor, offsets), where the vertices of polygon
+        ids[i] are xcor[offsets[i]:offsets[i + 1]] (same for ycor and zcor). This
+        is the same polygon order as a groupby on the id column, but without the
+        per group dataframe overhead.
+        """
+        pid = self._df[self.pname].to_numpy()
+        order = np.argsort(pid, kind="stable")
+        pid = pid[order]
+
+        def _sorted(name):
+            return np.ascontiguousarray(
+                self._df[name].to_numpy(dtype=np.float64)[order]
+            )
+
+        starts = np.flatnonzero(np.diff(pid)) + 1
+        offsets = np.concatenate(([0], starts, [pid.size])).astype(np.int64)
+        ids = pid[offsets[:-1]] if pid.size > 0 else pid
+        return (
+            ids,
+            _sorted(self.xname),
+            _sorted(self.yname),
+            _sorted(self.zname),
+            offsets,
+        )
+
     # ----------------------------------------------------------------------------------
     # Methods
     # ----------------------------------------------------------------------------------
@@ -563,7 +599,7 @@ class Polygons(XYZ):  # pylint: disable=too-many-public-methods
     def copy(self):
         """Returns a deep copy of an instance"""
         mycopy = self.__class__()
-        mycopy._df = self._df.apply(deepcopy)  # df.copy() is not fully deep!
+        mycopy._df = self._df.copy()
         mycopy._xname = self._xname
         mycopy._yname = self._yname
         mycopy._zname = self._zname
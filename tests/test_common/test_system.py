@@ -239,3 +239,27 @@ def test_detect_fformat_hdf_to_file(tmp_path, testpath, filename):
 def test_detect_fformat_suffix_only(testpath, filename, expected_format):
     xtgeo_file = xtgeo._XTGeoFile(testpath / filename)
     assert xtgeo_file.detect_fformat(suffixonly=True) == expected_format
+
+
+@pytest.mark.parametrize(
+    "proposal, expected_format",
+    [
+        ("roff", "roff_binary"),
+        ("roffasc", "roff_ascii"),
+        ("roff_something", "roff_binary"),
+        ("segy2", "segy"),
+        ("gri", "irap_binary"),
+    ],
+)
+def test_generic_format_by_proposal(proposal, expected_format):
+    assert xtgeo._XTGeoFile.generic_format_by_proposal(proposal) == expected_format
+
+
+def test_generic_format_by_proposal_invalid():
+    with pytest.raises(ValueError, match="Non-supportred"):
+        xtgeo._XTGeoFile.generic_format_by_proposal("nosuchformat")
+
+
+def test_detect_fformat_missing_file(tmp_path):
+    with pytest.raises(ValueError, match="does not exist"):
+        xtgeo._XTGeoFile(tmp_path / "missing.roff").detect_fformat()
@@ -2,9 +2,11 @@
 """Testing: test_grid_property"""
 
 
+import copy
 import io
 import os
 import pathlib
+import pickle
 
 import hypothesis.strategies as st
 import numpy as np
@@ -14,7 +16,19 @@ import xtgeo
 from hypothesis import HealthCheck, example, given, settings
 from xtgeo.common import XTGeoDialog
 from xtgeo.common.exceptions import KeywordNotFoundError
-from xtgeo.grid3d import Grid, GridProperty
+from xtgeo.grid3d import Grid, GridProperty, _gridprop_value_init
+from xtgeo.grid3d._gridprop_lowlevel import (
+    active_stats,
+    active_unique,
+    filled_values,
+    undef_mask,
+)
+from xtgeo.grid3d.grid_property import (
+    _data_reader_factory,
+    _detect_fformat_cached,
+    _resolve_fformat,
+    _smallest_continuous_dtype,
+)
 from xtgeo.xyz import Polygons
 
 from .grid_generator import dimensions, xtgeo_grids
@@ -117,6 +131,53 @@ def test_banal7(show_plot):
         layslice.show()
 
 
+@pytest.mark.parametrize(
+    "value, discrete, dtype",
+    [
+        (0, True, np.int32),
+        (3, True, np.int32),
+        (0.0, False, np.float64),
+        (3, False, np.float64),
+        (2.5, False, np.float64),
+    ],
+)
+def test_create_from_scalar(value, discrete, dtype):
+    x = GridProperty(ncol=3, nrow=2, nlay=2, values=value, discrete=discrete)
+    assert x.dtype == dtype
+    assert x.values.shape == (3, 2, 2)
+    assert np.all(x.values == value)
+
+
+@pytest.mark.parametrize("discrete", [True, False])
+def test_create_from_masked_array(discrete):
+    vals = npma.arange(12.0)
+    vals[3] = npma.masked
+    x = GridProperty(ncol=3, nrow=2, nlay=2, values=vals, discrete=discrete)
+    assert x.dtype == (np.int32 if discrete else np.float64)
+    assert x.values[0, 1, 1] is npma.masked
+    assert x.nactive == 11
+
+    x.values[0, 0, 0] = npma.masked
+    x.values[0, 0, 1] = 99
+    assert not vals.mask[0]
+    assert vals[1] == 1.0
+
+
+def test_values1d_is_view_for_fortran_input():
+    vals = np.asfortranarray(np.arange(12.0).reshape(3, 2, 2))
+    x = GridProperty(ncol=3, nrow=2, nlay=2, values=vals)
+    assert x.values.flags.c_contiguous
+
+    x.values1d[1] = 99.0
+    assert x.values[0, 0, 1] == 99.0
+
+    x.values = npma.array(vals, mask=np.zeros(vals.shape, dtype=bool, order="F"))
+    assert x.values.flags.c_contiguous
+    assert np.ma.getmask(x.values).flags.c_contiguous
+    x.values1d[2] = 99.0
+    assert x.values[0, 1, 0] == 99.0
+
+
 def test_assign():
     """Create a simple property and assign all values a constant"""
 
@@ -140,6 +201,130 @@ def test_assign():
     assert x.dtype == np.float64
 
 
+def test_assign_noncontiguous_values():
+    """Values set from strided or transposed arrays are stored C contiguous"""
+
+    vals = npma.array(np.arange(12.0).reshape((2, 2, 3)).T)
+    vals[0, 0, 0] = npma.masked
+    assert not vals.flags.c_contiguous
+
+    x = GridProperty(ncol=3, nrow=2, nlay=2, values=0.0)
+    x.values = vals
+    assert x.values.flags.c_contiguous
+    assert x.values.mask.flags.c_contiguous
+    assert x.values.mask[0, 0, 0]
+    np.testing.assert_array_equal(x.values, vals)
+
+
+def test_values1d_view():
+    """values1d is a 1D view of values, reused until values are replaced"""
+    x = GridProperty(ncol=3, nrow=2, nlay=2, values=np.arange(12.0))
+    x.values[0, 0, 0] = npma.masked
+
+    view = x.values1d
+    assert x.values1d is view
+    assert view.mask[0]
+    view[1] = 99.0
+    assert x.values[0, 0, 1] == 99.0
+
+    x.values = x.values + 1
+    assert x.values1d is not view
+    assert x.values1d[1] == 100.0
+
+
+@pytest.mark.parametrize("discrete", [True, False])
+def test_copy(discrete):
+    x = GridProperty(
+        ncol=3,
+        nrow=2,
+        nlay=2,
+        values=np.arange(12),
+        discrete=discrete,
+        codes={0: "zero", 1: "one"} if discrete else None,
+        name="facies",
+        date="20200101",
+        roxar_dtype=np.uint16 if discrete else np.float32,
+    )
+    x.values[0, 0, 0] = npma.masked
+
+    y = x.copy(newname="copied")
+    assert y.name == "copied"
+    assert y.date == "20200101"
+    assert y.isdiscrete is discrete
+    assert y.dtype == x.dtype
+    assert y.codes == x.codes
+    assert y.roxar_dtype == x.roxar_dtype
+    assert y.values1d.tolist() == x.values1d.tolist()
+
+    y.values[0, 0, 1] = 5
+    y.codes[5] = "five"
+    assert x.values[0, 0, 1] == 1
+    assert 5 not in x.codes
+
+
+def test_deepcopy():
+    """Deep copy gives independent values, mask and codes"""
+    x = GridProperty(
+        ncol=3,
+        nrow=2,
+        nlay=2,
+        values=np.arange(12),
+        discrete=True,
+        codes={0: "zero", 1: "one"},
+        name="facies",
+    )
+    x.values[0, 0, 0] = npma.masked
+    view = x.values1d
+
+    y = copy.deepcopy(x)
+    assert y.name == "facies"
+    assert y.isdiscrete
+    assert y.dtype == x.dtype
+    assert y.codes == x.codes
+    assert np.array_equal(y.values, x.values)
+    assert np.array_equal(y.values.mask, x.values.mask)
+
+    y.values1d[1] = 42
+    y.values[0, 1, 0] = npma.masked
+    y.codes[2] = "two"
+    assert x.values[0, 0, 1] == 1
+    assert not x.values.mask[0, 1, 0]
+    assert 2 not in x.codes
+    assert x.values1d is view
+
+
+def test_slots():
+    """GridProperty attributes are slots, but other attributes can still be set"""
+    x = GridProperty(ncol=3, nrow=2, nlay=2, values=1.0, name="poro")
+    assert "_values" not in vars(x)
+    x.userattribute = [1]
+    assert vars(x) == {"userattribute": [1]}
+
+    y = copy.copy(x)
+    assert y.name == "poro"
+    assert y.values is x.values
+    assert y.userattribute is x.userattribute
+
+    z = copy.deepcopy(x)
+    assert z.userattribute == [1]
+    assert z.userattribute is not x.userattribute
+
+    w = pickle.loads(pickle.dumps(x))
+    assert w.name == "poro"
+    assert w.userattribute == [1]
+
+
+def test_pickle_values1d():
+    """The values1d view of an unpickled property refers to its values"""
+    x = GridProperty(ncol=3, nrow=2, nlay=2, values=np.arange(12.0))
+    x.values[0, 0, 0] = npma.masked
+    x.values1d
+
+    y = pickle.loads(pickle.dumps(x))
+    y.values1d[1] = 99.0
+    assert y.values[0, 0, 1] == 99.0
+
+
 def test_create_actnum():
     """Test creating ACTNUM"""
     x = GridProperty()
@@ -153,6 +338,121 @@ def test_create_actnum():
     assert x.nactive < x.ntotal
 
 
+def test_nactive_follows_mask():
+    x = GridProperty(ncol=3, nrow=2, nlay=2, values=1.0)
+    assert x.nactive == 12
+
+    x.values[0, 0, 0] = npma.masked
+    assert x.nactive == 11
+    x.values.mask[1, 1, 1] = True
+    assert x.nactive == 10
+    assert x.nactive == len(x.actnum_indices)
+
+
+def test_actnum_indices():
+    x = GridProperty(ncol=3, nrow=2, nlay=2, values=np.arange(12.0))
+    x.values[0, 0, 1] = npma.masked
+    x.values[2, 1, 1] = npma.masked
+
+    indices = x.actnum_indices
+    assert indices.tolist() == [0] + list(range(2, 11))
+    assert np.array_equal(indices, np.flatnonzero(x.get_actnum().values1d))
+
+
+def test_get_actnum_from_mask():
+    x = GridProperty(ncol=3, nrow=2, nlay=2, values=np.arange(12.0))
+    x.values[0, 0, 1] = npma.masked
+
+    act = x.get_actnum()
+    assert act.dtype == np.int32
+    assert act.codes == {0: "0", 1: "1"}
+    assert act.values1d.tolist() == [1, 0] + [1] * 10
+
+    act = x.get_actnum(asmasked=True)
+    assert act.values1d.tolist() == [1, None] + [1] * 10
+
+
+@pytest.mark.parametrize("discrete", [True, False])
+def test_mask_undef(discrete):
+    undef = xtgeo.UNDEF_INT if discrete else xtgeo.UNDEF
+    x = GridProperty(ncol=2, nrow=2, nlay=1, values=np.arange(4), discrete=discrete)
+    x.values[0, 0, 0] = npma.masked
+    data = x.values.data
+    data[1, 1, 0] = undef
+
+    x.mask_undef()
+    assert np.shares_memory(x.values, data)
+    assert x.values.mask.ravel().tolist() == [True, False, False, True]
+    assert x.values1d.tolist() == [None, 1, 2, None]
+
+
+def test_mask_undef_keeps_nan():
+    """As before, mask_undef only masks values above the undef limit."""
+    x = GridProperty(ncol=2, nrow=2, nlay=1, values=np.arange(4.0))
+    data = x.values.data
+    data[0, 1, 0] = np.nan
+    data[1, 0, 0] = np.inf
+    data[1, 1, 0] = xtgeo.UNDEF
+
+    x.mask_undef()
+    assert x.values.mask.ravel().tolist() == [False, False, True, True]
+
+
+def test_get_data_and_mask_shares_memory():
+    x = GridProperty(ncol=2, nrow=1, nlay=1, values=npma.array([1.0, 2.0]))
+    x._values = npma.array(x.values.data)  # no mask (nomask)
+
+    data, mask = x._get_data_and_mask()
+    assert mask.shape == (2, 1, 1)
+    mask[1, 0, 0] = True
+    data[0, 0, 0] = 5.0
+    assert x.values1d.tolist() == [5.0, None]
+
+
+def test_crop():
+    values = np.ma.arange(24.0).reshape(2, 3, 4)
+    values[1, 1, 1] = npma.masked
+    x = GridProperty(ncol=2, nrow=3, nlay=4, values=values)
+
+    x.crop(((2, 2), (2, 3), (2, 3)))
+    assert x.dimensions == (1, 2, 2)
+    assert x.values.flags.c_contiguous
+    assert x.values1d.tolist() == [None, 18.0, 21.0, 22.0]
+
+    # the original array is not changed
+    assert values[1, 2, 2] == 22.0
+    x.values[0, 1, 1] = 100.0
+    assert values[1, 2, 2] == 22.0
+
+
+def test_setstate_ignores_removed_attributes():
+    x = GridProperty(ncol=2, nrow=1, nlay=1, values=np.array([1.0, 2.0]), name="a")
+    x.userattribute = 1
+    userstate, slots = x.__getstate__()
+    slots["_undef"] = xtgeo.UNDEF
+
+    y = GridProperty.__new__(GridProperty)
+    y.__setstate__((userstate, slots))
+    assert y.name == "a"
+    assert y.values1d.tolist() == [1.0, 2.0]
+    assert y.undef == xtgeo.UNDEF
+    assert vars(y) == {"userattribute": 1}
+
+
+def test_setstate_from_legacy_dict_state():
+    """Pickles from before the slots have a single dict as state."""
+    x = GridProperty(ncol=2, nrow=1, nlay=1, values=np.array([1.0, 2.0]), name="a")
+    _, slots = x.__getstate__()
+    state = dict(slots)
+    state["_undef"] = xtgeo.UNDEF
+
+    y = GridProperty.__new__(GridProperty)
+    y.__setstate__(state)
+    assert y.name == "a"
+    assert y.values1d.tolist() == [1.0, 2.0]
+    assert vars(y) == {}
+
+
 def test_undef():
     """Test getting UNDEF value"""
     xx = GridProperty()
@@ -175,6 +475,145 @@ def test_describe():
     assert "Name" in desc
 
 
+@pytest.mark.parametrize("chunksize", [7, 1048576])
+def test_active_stats(chunksize):
+    """Streamed statistics of active cells match numpy masked statistics"""
+    vals = npma.array(np.random.RandomState(1).normal(2.0, 0.5, (5, 4, 3)))
+    vals[vals > 2.5] = npma.masked
+
+    count, mean, std, vmin, vmax = active_stats(vals, chunksize=chunksize)
+    assert count == vals.count()
+    assert mean == pytest.approx(vals.mean())
+    assert std == pytest.approx(vals.std())
+    assert vmin == vals.min()
+    assert vmax == vals.max()
+
+    # fully inactive and fully active chunks
+    vals.mask = False
+    vals[:2] = npma.masked
+    count, mean, std, _, _ = active_stats(vals, chunksize=chunksize)
+    assert count == vals.count()
+    assert mean == pytest.approx(vals.mean())
+    assert std == pytest.approx(vals.std())
+
+    assert active_stats(npma.masked_all((2, 2, 2)))[0] == 0
+
+
+@pytest.mark.parametrize("order", ["C", "F"])
+@pytest.mark.parametrize("dtype", [None, np.float32, np.int32])
+def test_filled_values(order, dtype):
+    vals = npma.arange(24.0).reshape((2, 3, 4))
+    vals[1, 2, 3] = npma.masked
+
+    result = filled_values(vals, -999, dtype=dtype, order=order)
+    expected = vals.filled(-999).astype(dtype or vals.dtype)
+    assert result.dtype == expected.dtype
+    assert result.flags[f"{order}_CONTIGUOUS"]
+    assert np.array_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "vals, expected",
+    [
+        (np.array([3, 1, 3, 0], dtype=np.int32), [0, 1, 3]),
+        (np.array([-2, 70000, -2], dtype=np.int32), [-2, 70000]),
+        (npma.array([5, 1, 9], mask=[False, False, True]), [1, 5]),
+        (npma.masked_all((3,), dtype=np.int32), []),
+    ],
+)
+def test_active_unique(vals, expected):
+    assert active_unique(vals).tolist() == expected
+
+
+def test_continuous_to_discrete_codes():
+    x = GridProperty(ncol=4, nrow=1, nlay=1, values=np.array([1.5, 2.0, 7.0, 1.0]))
+    x.values[1, 0, 0] = npma.masked
+
+    x.isdiscrete = True
+    assert x.dtype == np.int32
+    assert x.codes == {1: "1", 7: "7"}
+    assert x.values1d.tolist() == [1, None, 7, 1]
+
+
+def test_undef_mask():
+    vals = np.array([1.0, np.nan, np.inf, -np.inf, xtgeo.UNDEF, -xtgeo.UNDEF])
+    assert undef_mask(vals, xtgeo.UNDEF_LIMIT).tolist() == [
+        False,
+        True,
+        True,
+        True,
+        True,
+        False,
+    ]
+
+    vals = np.array([1.0, np.nan, np.inf, -np.inf, xtgeo.UNDEF, -xtgeo.UNDEF])
+    assert undef_mask(vals, xtgeo.UNDEF_LIMIT, invalid=False).tolist() == [
+        False,
+        False,
+        True,
+        False,
+        True,
+        False,
+    ]
+
+    vals = np.array([[1, xtgeo.UNDEF_INT], [3, 4]], dtype=np.int32).T
+    mask = undef_mask(vals, xtgeo.UNDEF_INT_LIMIT)
+    assert mask.flags.c_contiguous
+    assert mask.tolist() == [[False, False], [True, False]]
+
+
+def test_values_setter_masks_undef():
+    x = GridProperty(ncol=2, nrow=2, nlay=1)
+    vals = np.ma.array(
+        [[[1.0, xtgeo.UNDEF], [np.nan, 4.0]]], mask=[[[True, False], [False, False]]]
+    ).T
+    assert not vals.flags.c_contiguous
+    x.values = vals
+    assert x.values.flags.c_contiguous
+    assert x.values1d.tolist() == [None, None, None, 4.0]
+    assert not np.shares_memory(x.values, vals)
+
+
+def test_values_setter_mask_handling():
+    x = GridProperty(ncol=2, nrow=1, nlay=1, values=np.array([1.0, 2.0]))
+    x.values[0, 0, 0] = npma.masked
+
+    # plain arrays keep the current mask, masked arrays bring their own
+    x.values = np.array([3.0, 4.0])
+    assert x.values1d.tolist() == [None, 4.0]
+    x.values = npma.array([5.0, 6.0]).reshape(2, 1, 1)
+    assert x.values1d.tolist() == [5.0, 6.0]
+
+
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_npvalues1d(order):
+    values = np.arange(12.0).reshape(3, 2, 2)
+    x = GridProperty(ncol=3, nrow=2, nlay=2, values=values)
+    expected = values.ravel(order=order)
+
+    for activeonly in (False, True):
+        result = x.get_npvalues1d(activeonly=activeonly, order=order)
+        assert not isinstance(result, npma.MaskedArray)
+        assert result.tolist() == expected.tolist()
+        assert not np.shares_memory(result, x.values)
+
+    x.values[0, 1, 0] = npma.masked
+    active = expected[expected != 2.0]
+    assert x.get_npvalues1d(activeonly=True, order=order).tolist() == active.tolist()
+    assert x.get_active_npvalues1d().tolist() == x.values.compressed().tolist()
+
+    result = x.get_npvalues1d(fill_value=-1.0, order=order)
+    assert result.tolist() == np.where(expected == 2.0, -1.0, expected).tolist()
+
+
+def test_npvalues1d_discrete_fill_value():
+    x = GridProperty(ncol=3, nrow=1, nlay=1, values=np.arange(3), discrete=True)
+    x.values[1, 0, 0] = npma.masked
+    assert x.get_npvalues1d(fill_value=-1, order="F").tolist() == [0, -1, 2]
+    with pytest.raises(TypeError, match="Cannot convert"):
+        x.get_npvalues1d()
+
+
 def test_npvalues3d():
     """Test getting numpy values as 3d"""
     xx = GridProperty()
@@ -189,6 +628,8 @@ def test_npvalues3d():
 
     mynp2 = xx.get_npvalues3d(fill_value=-999)
     assert mynp2[0, 0, 0] == -999
+    assert mynp2.dtype == np.float64
+    assert not np.shares_memory(mynp2, xx.values)
 
 
 def test_dtype():
@@ -484,6 +925,25 @@ def test_get_values_by_ijk():
     assert np.isnan(res1[0])
 
 
+@pytest.mark.parametrize("discrete", [True, False])
+def test_get_values_by_ijk_masked(discrete):
+    x = GridProperty(ncol=2, nrow=2, nlay=2, values=np.arange(8), discrete=discrete)
+    x.values[1, 1, 0] = npma.masked
+
+    res = x.get_values_by_ijk(
+        np.array([1, np.nan, 2, 2]),
+        np.array([1, np.nan, 2, 2]),
+        np.array([2, np.nan, 1, 2]),
+    )
+    assert res.dtype == np.float64
+    assert res[0] == 1.0
+    assert np.isnan(res[1])
+    assert np.isnan(res[2])
+    assert res[3] == 7.0
+
+    assert x.get_values_by_ijk(np.array([3]), np.array([1]), np.array([1])) is None
+
+
 def test_values_in_polygon():
     """Test replace values in polygons"""
 
@@ -743,3 +1203,209 @@ def test_simpleb8_case(simcase, props, snapshot):
         )
 
         snapshot.assert_match(str(gprop.values.round(10)), f"{prop}_{simcase}")
+
+
+def test_gridproperty_from_file_cached(tmp_path):
+    """Repeated imports of an unchanged file are served from cache as copies."""
+    prop = GridProperty(ncol=3, nrow=2, nlay=2, values=np.arange(12.0), name="P")
+    pfile = tmp_path / "cached.roff"
+    prop.to_file(pfile)
+
+    prop1 = xtgeo.gridproperty_from_file(pfile, name="P", cache=True)
+    prop2 = xtgeo.gridproperty_from_file(pfile, name="P", cache=True)
+    assert prop1 is not prop2
+    np.testing.assert_allclose(prop1.values, prop2.values)
+
+    # neither the first (read) nor later (cached) imports share values with the cache
+    prop1.values += 1.0
+    prop2.values += 1.0
+    prop3 = xtgeo.gridproperty_from_file(pfile, name="P", cache=True)
+    np.testing.assert_allclose(prop3.values, prop.values)
+
+    prop.values = 99.0
+    prop.to_file(pfile)
+    prop4 = xtgeo.gridproperty_from_file(pfile, name="P", cache=True)
+    assert prop4.values.mean() == 99.0
+
+
+def test_gridproperty_from_file_cache_optin_and_clear(tmp_path, monkeypatch):
+    pfile = tmp_path / "nocache.roff"
+    GridProperty(ncol=3, nrow=2, nlay=2, values=1.0, name="P").to_file(pfile)
+
+    reads = []
+    read_file_kwargs = GridProperty._read_file_kwargs
+
+    def counting_read(*args, **kwargs):
+        reads.append(args[0])
+        return read_file_kwargs(*args, **kwargs)
+
+    monkeypatch.setattr(GridProperty, "_read_file_kwargs", counting_read)
+
+    # the cache is not used by default
+    xtgeo.gridproperty_from_file(pfile, name="P")
+    xtgeo.gridproperty_from_file(pfile, name="P")
+    assert len(reads) == 2
+
+    xtgeo.gridproperty_cache_clear()
+    xtgeo.gridproperty_from_files([pfile] * 4, name="P", max_workers=4, cache=True)
+    assert len(reads) == 3
+
+    xtgeo.gridproperty_cache_clear()
+    xtgeo.gridproperty_from_file(pfile, name="P", cache=True)
+    assert len(reads) == 4
+
+    xtgeo.gridproperty_from_files([pfile] * 2, name="P")
+    assert len(reads) == 6
+
+
+@pytest.mark.parametrize("discrete", [True, False])
+def test_gridproperty_from_file_owns_values(tmp_path, discrete):
+    values = npma.array(np.arange(12).reshape(3, 2, 2), dtype=np.int32)
+    values[0, 0, 0] = npma.masked
+    prop = GridProperty(ncol=3, nrow=2, nlay=2, values=values, discrete=discrete)
+    prop.to_file(tmp_path / "prop.roff", name="PROP")
+
+    for imported in (
+        xtgeo.gridproperty_from_file(tmp_path / "prop.roff", name="PROP"),
+        GridProperty._read_file(tmp_path / "prop.roff", name="PROP"),
+        GridProperty().from_file(tmp_path / "prop.roff", name="PROP"),
+    ):
+        assert imported.isdiscrete is discrete
+        assert imported.dtype == (np.int32 if discrete else np.float64)
+        assert imported.values.flags.c_contiguous
+        assert imported.values1d.tolist() == prop.values1d.tolist()
+
+    # the import cache is not changed by changes to imported values
+    pfile = tmp_path / "prop.roff"
+    imported = xtgeo.gridproperty_from_file(pfile, name="PROP", cache=True)
+    imported.values[0, 0, 1] = 100
+    imported = xtgeo.gridproperty_from_file(pfile, name="PROP", cache=True)
+    assert imported.values[0, 0, 1] == 1
+
+
+def test_gridproperty_from_file_no_default_values(tmp_path, monkeypatch):
+    prop = GridProperty(ncol=3, nrow=2, nlay=2, values=1.0)
+    prop.to_file(tmp_path / "prop.roff", name="PROP")
+
+    def fail(*_):
+        raise AssertionError("default values allocated on import")
+
+    monkeypatch.setattr(_gridprop_value_init, "gridproperty_non_dummy_values", fail)
+    imported = GridProperty._read_file(tmp_path / "prop.roff", name="PROP")
+    assert imported.values.tolist() == prop.values.tolist()
+
+
+def test_gridproperty_from_file_format_case(tmp_path):
+    prop = GridProperty(ncol=2, nrow=1, nlay=1, values=np.array([1.0, 2.0]))
+    prop.to_file(tmp_path / "prop.roff", name="PROP")
+
+    imported = xtgeo.gridproperty_from_file(
+        tmp_path / "prop.roff", fformat="ROFF", name="PROP"
+    )
+    assert imported.values1d.tolist() == [1.0, 2.0]
+
+    with pytest.raises(ValueError, match="Invalid grid property file format"):
+        _data_reader_factory("irap_binary")
+
+
+def test_deprecated_init_from_pfile_keyword(tmp_path):
+    prop = GridProperty(ncol=2, nrow=1, nlay=1, values=np.array([1.0, 2.0]))
+    prop.to_file(tmp_path / "prop.roff", name="PROP")
+
+    with pytest.warns(DeprecationWarning, match="from file name is deprecated"):
+        imported = GridProperty(pfile=tmp_path / "prop.roff", name="PROP")
+    assert imported.values1d.tolist() == [1.0, 2.0]
+
+
+def test_gridproperty_from_files(tmp_path):
+    """Concurrent import of several files keeps the input order."""
+    pfiles = []
+    for num in range(5):
+        pfile = tmp_path / f"real{num}.roff"
+        GridProperty(ncol=3, nrow=2, nlay=2, values=float(num), name="P").to_file(pfile)
+        pfiles.append(pfile)
+
+    props = xtgeo.gridproperty_from_files(pfiles, name="P", max_workers=3)
+    assert [prop.values.mean() for prop in props] == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert all(prop.dimensions == (3, 2, 2) for prop in props)
+
+
+def test_resolve_fformat_memoized(tmp_path):
+    """Format detection of an unchanged file is done once."""
+    pfile = tmp_path / "detect.roff"
+    GridProperty(ncol=3, nrow=2, nlay=2, values=1.0).to_file(pfile)
+
+    hits = _detect_fformat_cached.cache_info().hits
+    assert _resolve_fformat(xtgeo._XTGeoFile(pfile), None) == "roff_binary"
+    assert _resolve_fformat(xtgeo._XTGeoFile(pfile), "guess") == "roff_binary"
+    assert _detect_fformat_cached.cache_info().hits == hits + 1
+
+    assert _resolve_fformat(xtgeo._XTGeoFile(pfile), "grdecl") == "grdecl"
+    stream = io.BytesIO(pfile.read_bytes())
+    assert _resolve_fformat(xtgeo._XTGeoFile(stream), None) == "roff_binary"
+
+
+def test_operation_polygons_keeps_mask():
+    """Operations inside/outside polygons do not touch undefined cells."""
+    grid = xtgeo.create_box_grid((4, 3, 2))
+    poly = Polygons(
+        [
+            (0.5, 0.5, 0, 0),
+            (2.5, 0.5, 0, 0),
+            (2.5, 2.5, 0, 0),
+            (0.5, 2.5, 0, 0),
+            (0.5, 0.5, 0, 0),
+        ]
+    )
+    vals = npma.arange(1.0, 25.0).reshape((4, 3, 2))
+    vals[0, 0, 0] = npma.masked
+    prop = GridProperty(grid, values=vals)
+    prop.geometry = grid
+
+    other = npma.ones((4, 3, 2)) * 10.0
+    other[1, 1, 1] = npma.masked
+    prop.add_inside(poly, other)
+
+    assert prop.values.mask[0, 0, 0]
+    assert prop.values.data[0, 0, 0] == 1.0
+    assert prop.values.mask[1, 1, 1]
+    assert prop.values[1, 1, 0] == vals[1, 1, 0] + 10.0
+    assert prop.values[3, 2, 1] == vals[3, 2, 1]
+
+
+@pytest.mark.parametrize(
+    "codes, expected",
+    [((1, 4), np.uint8), ((-1, 4), np.int16), ((1, 40000), np.uint16)],
+)
+def test_gridproperty_from_file_auto_dtype(tmp_path, codes, expected):
+    """Discrete properties can be imported with the smallest suitable dtype."""
+    vals = np.array([codes[0], codes[1]] * 6).reshape((3, 2, 2))
+    prop = GridProperty(ncol=3, nrow=2, nlay=2, values=vals, discrete=True, name="F")
+    pfile = tmp_path / "facies.roff"
+    prop.to_file(pfile)
+
+    prop1 = xtgeo.gridproperty_from_file(pfile, name="F", dtype="auto")
+    assert prop1.dtype == expected
+    assert prop1.values.tolist() == prop.values.tolist()
+
+    prop2 = xtgeo.gridproperty_from_file(pfile, name="F")
+    assert prop2.dtype == np.int32
+
+
+def test_gridproperty_from_file_auto_dtype_continuous(tmp_path):
+    """Continuous properties are imported as float32 if no precision is lost."""
+    vals = npma.array(np.linspace(0.0, 1.0, 12).reshape((3, 2, 2)))
+    vals[0, 0, 0] = npma.masked
+    prop = GridProperty(ncol=3, nrow=2, nlay=2, values=vals, name="PORO")
+    pfile = tmp_path / "poro.roff"
+    prop.to_file(pfile)  # roff stores float32
+
+    prop1 = xtgeo.gridproperty_from_file(pfile, name="PORO", dtype="auto")
+    assert prop1.dtype == np.float32
+    prop2 = xtgeo.gridproperty_from_file(pfile, name="PORO")
+    assert prop2.dtype == np.float64
+    assert prop1.values1d.tolist() == prop2.values1d.tolist()
+
+    # linspace values are not exact in float32
+    assert _smallest_continuous_dtype(prop.values) == np.float64
+    assert _smallest_continuous_dtype(prop2.values) == np.float32
@@ -155,6 +155,20 @@ def test_xtgeo_codes(param, expected_codes):
     assert param.xtgeo_codes() == expected_codes
 
 
+@pytest.mark.parametrize(
+    "values", [np.arange(24, dtype=np.int32), np.arange(24.0), bytes(range(24))]
+)
+def test_xtgeo_values_does_not_share_buffer(values):
+    param = RoffParameter(2, 3, 4, "", values)
+    xtgeo_values = param.xtgeo_values()
+
+    assert xtgeo_values.flags.c_contiguous
+    assert xtgeo_values.flags.writeable
+    assert xtgeo_values[0, 0, 0] == 3
+    if isinstance(values, np.ndarray):
+        assert not np.shares_memory(xtgeo_values, values)
+
+
 def test_to_file(tmp_path):
     roff_param = RoffParameter(1, 1, 2, "", b"\x01\xFF")
     roff_param.to_file(tmp_path / "param.roff")
@@ -314,6 +314,54 @@ def test_match_dualporo():
     assert matched_values[0, 0, 3] == 1.0
 
 
+def test_restart_sections_stop_after_last_date(monkeypatch):
+    monkeypatch.setattr(xtg_im_ecl, "peek_headers", lambda sec: (sec, None, sec))
+    monkeypatch.setattr(xtg_im_ecl, "check_grid_match", lambda *args: None)
+    monkeypatch.setattr(xtg_im_ecl, "date_from_intehead", lambda date: date)
+    monkeypatch.setattr(xtg_im_ecl, "valid_gridprop_lengths", lambda grid: [])
+    monkeypatch.setattr(
+        xtg_im_ecl, "read_values", lambda sec, head, names, lengths: {"PROP": sec}
+    )
+    monkeypatch.setattr(
+        xtg_im_ecl,
+        "gridprop_params",
+        lambda values, name, date, grid, fracture: {"name": name, "date": date},
+    )
+
+    def sections():
+        yield 19991231
+        yield 20000101
+        yield 20010101
+        yield 20020101
+        raise AssertionError("read past the last requested date")
+
+    assert xtg_im_ecl.find_gridprops_from_restart_file_sections(
+        sections(), ["PROP"], [20000101, 20010101], grid=None
+    ) == [{"name": "PROP", "date": 20000101}, {"name": "PROP", "date": 20010101}]
+
+
+def test_restart_sections_with_dates_out_of_order(monkeypatch):
+    monkeypatch.setattr(xtg_im_ecl, "peek_headers", lambda sec: (sec, None, sec))
+    monkeypatch.setattr(xtg_im_ecl, "check_grid_match", lambda *args: None)
+    monkeypatch.setattr(xtg_im_ecl, "date_from_intehead", lambda date: date)
+    monkeypatch.setattr(xtg_im_ecl, "valid_gridprop_lengths", lambda grid: [])
+    monkeypatch.setattr(
+        xtg_im_ecl, "read_values", lambda sec, head, names, lengths: {"PROP": sec}
+    )
+    monkeypatch.setattr(
+        xtg_im_ecl,
+        "gridprop_params",
+        lambda values, name, date, grid, fracture: {"name": name, "date": date},
+    )
+
+    # a restarted run, where the dates go back in time
+    sections = [20000101, 20020101, 20030101, 20010101, 20020101]
+
+    assert xtg_im_ecl.find_gridprops_from_restart_file_sections(
+        iter(sections), ["PROP"], [20000101, 20010101], grid=None
+    ) == [{"name": "PROP", "date": 20000101}, {"name": "PROP", "date": 20010101}]
+
+
 property_names = st.text(
     min_size=8, max_size=8, alphabet=st.characters(min_codepoint=40, max_codepoint=126)
 )
@@ -169,3 +169,35 @@ def test_export_points_rmsattr(testpath, tmp_path):
 
     assert mypoints.dataframe["Seg"].equals(mypoints2.dataframe["Seg"])
     assert mypoints.dataframe["MyNum"].equals(mypoints2.dataframe["MyNum"])
+
+
+def test_rename_coordinate_columns():
+    mypoints = Points([(234, 556, 11), (235, 559, 14)])
+    dfr = mypoints.dataframe
+
+    mypoints.xname = "X"
+    mypoints.zname = "DEPTH"
+
+    assert mypoints.dataframe is dfr
+    assert list(dfr.columns) == ["X", "Y_UTMN", "DEPTH"]
+    assert list(dfr["DEPTH"]) == [11, 14]
+
+
+def test_points_from_file_unsupported_format(tmp_path):
+    Points([(1.0, 2.0, 3.0), (2.0, 3.0, 4.0)]).to_file(tmp_path / "points.poi")
+    with pytest.raises(ValueError, match="Unknown file format"):
+        xtgeo.points_from_file(tmp_path / "points.poi", fformat="roff")
+
+
+def test_export_single_point(tmp_path):
+    export_path = tmp_path / "single.xyz"
+    assert Points([(1.0, 2.0, 3.0)]).to_file(export_path) == 1
+    assert export_path.read_text() == "1.000 2.000 3.000\n"
+
+
+def test_export_points_undefined_as_999(tmp_path):
+    mypoints = Points([(1.0, 2.0, 3.0), (2.0, 3.0, 4.0)])
+    mypoints.dataframe.loc[1, mypoints.zname] = np.nan
+    export_path = tmp_path / "undef.xyz"
+    mypoints.to_file(export_path)
+    assert export_path.read_text() == "1.000 2.000 3.000\n2.000 3.000 999.000\n"
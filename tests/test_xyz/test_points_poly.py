@@ -1,9 +1,12 @@
 import pathlib
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from xtgeo.xyz import Points
 from xtgeo.xyz import Polygons
+from xtgeo.xyz import _xyz_oper
 
 POLSET2 = pathlib.Path("polygons/reek/1/polset2.pol")
 POINTSET2 = pathlib.Path("points/reek/1/pointset2.poi")
@@ -236,3 +239,83 @@ def test_oper_points_inside_overlapping_polygon(oper, expected):
     # point is outside
     poi.operation_polygons(pol, value=2, opname=oper, inside=False)
     assert list(poi.dataframe[poi.zname].values) == expected
+
+
+def test_oper_points_with_integer_columns():
+    pol = Polygons(SMALL_POLY_INNER)
+    poi = Points(
+        pd.DataFrame(
+            {"X_UTME": [4, 7], "Y_UTMN": [4, 7], "Z_TVDSS": [10, 10]},
+        )
+    )
+    poi.operation_polygons(pol, value=2.5, opname="add", inside=True)
+    assert list(poi.dataframe[poi.zname].values) == [12.5, 10.0]
+
+
+def test_oper_points_with_open_polygon_raises():
+    pol = Polygons(SMALL_POLY_INNER[:-1])
+    poi = Points([(4.0, 4.0, 10.0), (7.0, 7.0, 10.0)])
+    with pytest.raises(RuntimeError, match="code 1"):
+        poi.operation_polygons(pol, value=2, opname="add", inside=True)
+
+
+@pytest.mark.parametrize("inside", [True, False])
+def test_oper_many_points_star_polygon(inside):
+    """Many points are classified by a raster, which shall match the exact test."""
+    angle = np.linspace(0, 2 * np.pi, 200)
+    radius = 5 + 2 * np.sin(7 * angle)
+    pxcor = 5 + radius * np.cos(angle)
+    pycor = 5 + radius * np.sin(angle)
+    pxcor[-1], pycor[-1] = pxcor[0], pycor[0]
+    pol = Polygons(np.column_stack([pxcor, pycor, np.zeros(200), np.zeros(200)]))
+
+    xcor, ycor = np.random.default_rng(1).uniform(-2, 12, (2, 20000))
+    poi = Points(np.column_stack([xcor, ycor, np.zeros(20000)]))
+    poi.operation_polygons(pol, value=1, opname="set", inside=inside)
+
+    expected = _xyz_oper._exact_status(xcor, ycor, pxcor, pycor) == int(inside)
+    assert np.array_equal(poi.dataframe[poi.zname].values == 1, expected)
+
+
+def test_polygon_raster_is_reused_until_polygon_changes():
+    pol = Polygons(LARGE_POLY_ENCOMPASS)
+    xcor, ycor = np.random.default_rng(1).uniform(0, 10, (2, 5000))
+    poi = Points(np.column_stack([xcor, ycor, np.zeros(5000)]))
+
+    poi.add_inside(pol, 1)
+    raster = pol._raster_cache[10]
+    poi.sub_inside(pol, 1)
+    assert pol._raster_cache[10] is raster
+
+    pol.dataframe[pol.xname] += 1.0
+    poi.add_inside(pol, 1)
+    assert pol._raster_cache[10] is not raster
+    assert (poi.dataframe[poi.zname] == (xcor >= 1)).all()
+
+
+def test_oper_points_inside_many_polygons():
+    """Many polygons, where the points near each polygon are found from a tree."""
+    squares = []
+    for id_ in range(400):
+        x0, y0 = 2.0 * (id_ % 20), 2.0 * (id_ // 20)
+        corners = [(0, 0), (1, 0), (1, 1), (0, 1), (0, 0)]
+        squares.extend((x0 + dx, y0 + dy, 0.0, id_) for dx, dy in corners)
+    pol = Polygons(squares)
+
+    xcor, ycor = np.random.default_rng(2).uniform(0, 40, (2, 5000))
+    poi = Points(np.column_stack([xcor, ycor, np.zeros(5000)]))
+    poi.add_inside(pol, 1)
+
+    expected = (xcor % 2.0 < 1.0) & (ycor % 2.0 < 1.0)
+    assert (poi.dataframe[poi.zname] == expected).all()
+
+
+@pytest.mark.parametrize("inside", [True, False])
+def test_oper_points_with_undefined_coordinates(inside):
+    """Points with NaN X or Y are left unchanged, both inside and outside."""
+    pol = Polygons([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (0, 0, 0)])
+    poi = Points([(np.nan, 0.5, 1.0), (5.0, np.nan, 1.0), (0.5, 0.5, 1.0), (5, 5, 1)])
+    poi.operation_polygons(pol, 2.0, opname="add", inside=inside)
+
+    expected = [1.0, 1.0, 3.0, 1.0] if inside else [1.0, 1.0, 1.0, 3.0]
+    assert poi.dataframe[poi.zname].tolist() == expected
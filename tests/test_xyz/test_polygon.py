@@ -391,6 +391,23 @@ def test_delete_columns_protected_columns():
     assert pol.zname in pol.dataframe
 
 
+def test_delete_several_columns():
+    pol = Polygons([(1, 2, 3), (2, 3, 4)])
+    pol.hlen()
+    pol.tlen()
+    with pytest.warns(UserWarning, match="protected and will not be deleted"):
+        pol.delete_columns([pol.dhname, pol.xname, pol.tname, pol.dhname])
+
+    assert list(pol.dataframe.columns) == [
+        pol.xname,
+        pol.yname,
+        pol.zname,
+        pol.pname,
+        pol.hname,
+        pol.dtname,
+    ]
+
+
 def test_delete_columns_strict_raises():
     pol = Polygons()
     with pytest.raises(ValueError, match="not present"):
@@ -536,3 +553,27 @@ def test_shortform_polygons_overlap(functionname, expected):
         getattr(poi, functionname)(pol, 2.0)
 
     assert list(poi.dataframe[poi.zname].values) == expected
+
+
+def test_dataframe_setter_copies():
+    pol = Polygons([(1, 2, 3), (2, 3, 4)])
+    dfr = pol.dataframe.copy()
+    pol.dataframe = dfr
+    dfr.loc[0, pol.zname] = 99.0
+
+    assert pol.dataframe is not dfr
+    assert list(pol.dataframe[pol.zname]) == [3.0, 4.0]
+    assert pol.copy().dataframe.equals(pol.dataframe)
+
+
+def test_vertex_rings_follow_polygon_id_order():
+    pol = Polygons(
+        [(5, 6, 7, 2), (1, 2, 3, 0), (8, 9, 10, 2), (2, 3, 4, 0), (3, 4, 5, 1)]
+    )
+    ids, xcor, ycor, zcor, offsets = pol._vertex_rings()
+
+    assert list(ids) == [0, 1, 2]
+    assert list(offsets) == [0, 2, 3, 5]
+    assert list(xcor) == [1.0, 2.0, 3.0, 5.0, 8.0]
+    assert list(ycor) == [2.0, 3.0, 4.0, 6.0, 9.0]
+    assert list(zcor) == [3.0, 4.0, 5.0, 7.0, 10.0]